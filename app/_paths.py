@@ -12,6 +12,9 @@
 import os
 import sys
 
+# Konstan selama proses berjalan — cukup dicek sekali saat import
+IS_FROZEN = getattr(sys, 'frozen', False)
+
 
 def get_app_root() -> str:
     """
@@ -21,7 +24,7 @@ def get_app_root() -> str:
     - Development: folder tempat main.py berada
     - PyInstaller:  folder tempat .exe berada
     """
-    if getattr(sys, 'frozen', False):
+    if IS_FROZEN:
         # PyInstaller bundle → folder tempat .exe berada
         return os.path.dirname(sys.executable)
     else:
@@ -36,7 +39,7 @@ def get_bundle_root() -> str:
     - Development: sama dengan app_root
     - PyInstaller:  sys._MEIPASS (temp extraction dir)
     """
-    if getattr(sys, 'frozen', False):
+    if IS_FROZEN:
         return sys._MEIPASS
     else:
         return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -50,6 +53,7 @@ MODELS_DIR = os.path.join(APP_ROOT, "models")
 ASSETS_DIR = os.path.join(get_bundle_root(), "assets")
 ICON_PNG_PATH = os.path.join(ASSETS_DIR, "icon.png")
 ICON_ICO_PATH = os.path.join(ASSETS_DIR, "icon.ico")
+TRAY_FALLBACK_PNG_PATH = os.path.join(ASSETS_DIR, "tray_fallback.png")
 
 # ── Dynamic APPDATA Paths ──
 if os.name == 'nt':
@@ -67,4 +71,5 @@ WORDLIST_PATH = os.path.join(APPDATA_DIR, "word_list.json")
 GUARD_CONFIG_PATH = os.path.join(APPDATA_DIR, "installer_guard_config.json")
 CSV_PATH = os.path.join(LOGS_DIR, "toxic_incidents.csv")
 CONFIG_PATH = os.path.join(APPDATA_DIR, "config.json")
+UPDATE_CACHE_PATH = os.path.join(APPDATA_DIR, "update_etag.json")
 
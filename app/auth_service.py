@@ -11,11 +11,14 @@
 # =============================================================
 
 import os
+import copy
 import json
 import time
 import hashlib
 import secrets
 import logging
+import threading
+from typing import Tuple
 
 from app._paths import CONFIG_PATH
 
@@ -40,6 +43,10 @@ class AuthService:
         self._authenticated: bool = False
         self._attempt_count: int = 0
         self._lockout_until: float = 0.0  # timestamp
+        self._save_lock = threading.Lock()  # _save_config bisa dipanggil dari thread background
+        # Nomor urut snapshot config; file hanya ditimpa oleh snapshot yang lebih baru
+        self._snapshot_gen: int = 0
+        self._written_gen: int = 0
 
         # Load or initialize config
         self._config: dict = self._load_config()
@@ -66,17 +73,50 @@ class AuthService:
     def _save_config(self):
         """Save current config to config.json."""
         try:
-            # Ensure directory exists
-            config_dir = os.path.dirname(CONFIG_PATH)
-            if config_dir and not os.path.isdir(config_dir):
-                os.makedirs(config_dir, exist_ok=True)
-
-            with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, ensure_ascii=False, indent=4)
-            logger.info("✓ Config saved to %s", CONFIG_PATH)
+            self.write_config_text(*self.snapshot_config())
         except Exception as e:
             logger.error("✗ Failed to save config: %s", e)
 
+    def snapshot_config(self) -> Tuple[int, str]:
+        """
+        Serialisasi config ke JSON — panggil di thread yang memodifikasi
+        config (UI thread). Deep copy dulu agar nested list/dict yang masih
+        diedit UI tidak ikut terbaca setengah jadi.
+
+        Returns:
+            (generation, json_text) untuk ``write_config_text``.
+        """
+        with self._save_lock:
+            self._snapshot_gen += 1
+            text = json.dumps(copy.deepcopy(self._config), ensure_ascii=False, indent=4)
+            return self._snapshot_gen, text
+
+    def write_config_text(self, generation: int, text: str) -> bool:
+        """
+        Tulis JSON hasil ``snapshot_config`` ke config.json.
+        Aman dipanggil dari thread background; error di-raise ke caller.
+
+        Snapshot yang lebih lama dari yang sudah tertulis dilewati, jadi
+        tulis yang tertunda di thread lain tidak bisa menimpa config terbaru.
+
+        Returns:
+            False jika snapshot sudah usang (tidak ditulis).
+        """
+        # Ensure directory exists
+        config_dir = os.path.dirname(CONFIG_PATH)
+        if config_dir and not os.path.isdir(config_dir):
+            os.makedirs(config_dir, exist_ok=True)
+
+        with self._save_lock:
+            if generation <= self._written_gen:
+                logger.debug("Config snapshot #%d superseded — skip write", generation)
+                return False
+            with open(CONFIG_PATH, "w", encoding="utf-8") as f:
+                f.write(text)
+            self._written_gen = generation
+        logger.info("✓ Config saved to %s", CONFIG_PATH)
+        return True
+
     def _ensure_password_exists(self):
         """
         Jika belum ada password_hash / password_salt di config,
@@ -222,6 +262,20 @@ class AuthService:
         self._config[key] = value
         self._save_config()
 
+    def update_config_batch(self, values: dict, persist: bool = True):
+        """
+        Update beberapa config sekaligus dengan satu kali tulis file.
+
+        Args:
+            values: Mapping key → value.
+            persist: False untuk hanya update di memori (caller menyimpan
+                     sendiri via ``snapshot_config`` + ``write_config_text``,
+                     misal menulis file di thread background).
+        """
+        self._config.update(values)
+        if persist:
+            self._save_config()
+
     # ================================================================
     # HASHING
     # ================================================================
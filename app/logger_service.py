@@ -17,7 +17,7 @@ import threading
 import time
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
 
 # ── Logging ────────────────────────────────────────────────────
 logger = logging.getLogger("GCToxicShield.Logger")
@@ -96,9 +96,14 @@ class LoggerService:
         self._purge_interval = purge_interval
         self._on_purge = on_purge
 
-        # ── Buffers ──
-        self._temp_buffer: List[TranscriptionEntry] = []
+        # ── Temp buffer (SoA: satu list per kolom, indeks paralel) ──
+        # matched_words sudah di-join saat insert agar render UI tidak
+        # perlu mengalokasi string per entry.
         self._buffer_lock = threading.Lock()
+        self._col_timestamps: List[str] = []
+        self._col_texts: List[str] = []
+        self._col_is_toxic: List[bool] = []
+        self._col_matched_joined: List[str] = []
 
         # ── State ──
         self._running = False
@@ -190,9 +195,14 @@ class LoggerService:
             matched_words=matched_words or [],
         )
 
+        matched_joined = ", ".join(entry.matched_words)
+
         # ── Tambah ke temp buffer ──
         with self._buffer_lock:
-            self._temp_buffer.append(entry)
+            self._col_timestamps.append(entry.timestamp)
+            self._col_texts.append(entry.text)
+            self._col_is_toxic.append(entry.is_toxic)
+            self._col_matched_joined.append(matched_joined)
             self._total_logged += 1
 
         # ── Jika TOXIC: simpan ke permanent CSV ──
@@ -208,16 +218,40 @@ class LoggerService:
 
     def get_buffer(self) -> List[TranscriptionEntry]:
         """
-        Mengambil salinan temp_buffer saat ini.
-        Digunakan oleh UI untuk menampilkan Live Monitor.
+        Mengambil salinan temp_buffer saat ini sebagai list entry
+        (dibangun ulang dari kolom).
+        """
+        with self._buffer_lock:
+            rows = list(zip(
+                self._col_timestamps, self._col_texts,
+                self._col_is_toxic, self._col_matched_joined,
+            ))
+        return [
+            TranscriptionEntry(
+                text=tx, timestamp=ts, is_toxic=tox,
+                matched_words=mw.split(", ") if mw else [],
+            )
+            for ts, tx, tox, mw in rows
+        ]
+
+    def get_columns(self) -> Tuple[List[str], List[bool], List[str]]:
+        """
+        Mengambil salinan kolom yang dibaca Live Monitor:
+        (texts, is_toxic, matched_words_joined).
+
+        Loop render cukup ``zip()`` atas list lokal tanpa akses atribut per entry.
         """
         with self._buffer_lock:
-            return self._temp_buffer.copy()
+            return (
+                self._col_texts.copy(),
+                self._col_is_toxic.copy(),
+                self._col_matched_joined.copy(),
+            )
 
     def get_buffer_size(self) -> int:
         """Jumlah entry dalam temp_buffer."""
         with self._buffer_lock:
-            return len(self._temp_buffer)
+            return len(self._col_texts)
 
     @property
     def stats(self) -> dict:
@@ -258,21 +292,22 @@ class LoggerService:
         boleh ada jejaknya di storage permanen.
         """
         with self._buffer_lock:
-            before_count = len(self._temp_buffer)
+            before_count = len(self._col_texts)
 
             # Hapus semua entry yang TIDAK toxic
-            self._temp_buffer = [
-                entry for entry in self._temp_buffer
-                if entry.is_toxic
-            ]
+            keep = [i for i, toxic in enumerate(self._col_is_toxic) if toxic]
+            self._col_timestamps = [self._col_timestamps[i] for i in keep]
+            self._col_texts = [self._col_texts[i] for i in keep]
+            self._col_is_toxic = [True] * len(keep)
+            self._col_matched_joined = [self._col_matched_joined[i] for i in keep]
 
-            purged_count = before_count - len(self._temp_buffer)
+            purged_count = before_count - len(keep)
             self._total_purged += purged_count
 
         if purged_count > 0:
             logger.info(
                 "🧹 Auto-purge: %d safe entries cleared | remaining=%d (toxic only)",
-                purged_count, len(self._temp_buffer)
+                purged_count, len(keep)
             )
 
             # Callback opsional
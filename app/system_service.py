@@ -12,6 +12,8 @@ import sys
 import logging
 from typing import Optional
 
+from app._paths import IS_FROZEN
+
 # ── Logging ────────────────────────────────────────────────────
 logger = logging.getLogger("GCToxicShield.System")
 
@@ -51,7 +53,7 @@ class SystemService:
 
             if app_path is None:
                 # Jika dijalankan sebagai .exe (PyInstaller)
-                if getattr(sys, 'frozen', False):
+                if IS_FROZEN:
                     app_path = f'"{sys.executable}"'
                 else:
                     # Jalankan sebagai Python script
@@ -11,21 +11,23 @@
 
 import os
 import csv
+import copy
 import json
 import time
 import logging
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Callable, List, Dict, Any
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QFrame, QLabel, QPushButton, QStackedWidget, QTextEdit, 
+    QFrame, QLabel, QPushButton, QStackedWidget, QTextEdit, QPlainTextEdit,
     QProgressBar, QGridLayout, QSlider, QComboBox, QLineEdit,
-    QCheckBox, QListWidget, QListWidgetItem, QMessageBox, QButtonGroup,
+    QCheckBox, QListWidget, QMessageBox, QButtonGroup,
     QScrollArea, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
-    QSpinBox, QDoubleSpinBox
+    QSpinBox, QDoubleSpinBox, QFileDialog
 )
-from PySide6.QtCore import Qt, QTimer, QSize
+from PySide6.QtCore import Qt, QTimer, QSize, QEvent
 from PySide6.QtGui import QFont, QIcon, QColor, QTextCursor
 from PySide6.QtWidgets import QGraphicsDropShadowEffect
 
@@ -34,6 +36,13 @@ logger = logging.getLogger("GCToxicShield.UI")
 # ── Timer Intervals ──
 REFRESH_INTERVAL_MS = 2000
 VU_METER_INTERVAL_MS = 80
+REFRESH_TICKS = REFRESH_INTERVAL_MS // VU_METER_INTERVAL_MS  # Monitor refresh tiap N tick VU
+GAIN_DEBOUNCE_MS = 50
+
+# ── Incident log severity badges ──
+_SEV_ICON = {"HIGH": "🔴 ", "MEDIUM": "🟡 ", "LOW": "🟢 "}
+# Teks kolom severity siap pakai (ikon + nama) — tanpa concat string per baris
+_SEV_LABEL = {sev: icon + sev for sev, icon in _SEV_ICON.items()}
 
 # ── Design Tokens (Obsidian Cyberpunk v2.1.0) ──
 BG       = "#080A10"
@@ -102,7 +111,7 @@ QPushButton.SegBtn:checked {{
 }}
 
 /* TextBoxes, LineEdits, and Tables */
-QTextEdit, QLineEdit, QListWidget, QTableWidget, QSpinBox, QDoubleSpinBox {{
+QTextEdit, QPlainTextEdit, QLineEdit, QListWidget, QTableWidget, QSpinBox, QDoubleSpinBox {{
     background-color: {ENTRY_BG};
     color: {TEXT};
     border: 1px solid {BORDER};
@@ -199,7 +208,8 @@ QCheckBox::indicator:checked {{
 """
 
 # ── Imports ──
-from app._paths import WORDLIST_PATH, CSV_PATH, ICON_ICO_PATH
+from app._paths import WORDLIST_PATH, CSV_PATH, ICON_ICO_PATH, GUARD_CONFIG_PATH
+from app.system_service import SystemService
 
 
 def create_shadow() -> QGraphicsDropShadowEffect:
@@ -213,6 +223,17 @@ def create_shadow() -> QGraphicsDropShadowEffect:
 class AdminDashboard(QMainWindow):
     """GC Toxic Shield — Admin Dashboard UI (PySide6)."""
 
+    # Memo kelas GithubUpdater: modul updater (urllib3/ijson) baru di-import
+    # saat pertama kali cek update, bukan saat startup
+    _GithubUpdater = None
+
+    @classmethod
+    def _updater_cls(cls):
+        if cls._GithubUpdater is None:
+            from app.updater import GithubUpdater
+            cls._GithubUpdater = GithubUpdater
+        return cls._GithubUpdater
+
     def __init__(
         self,
         logger_service: "LoggerService",
@@ -234,6 +255,23 @@ class AdminDashboard(QMainWindow):
         self._github_repo = github_repo
         self._installer_guard = None
         self._on_close = on_close
+        self._aliases_by_word: Dict[str, List[str]] = {}
+        self._variant_root: Dict[str, str] = {}
+        self._device_indices: List[int] = []  # Shadow list of _device_dropdown
+        self._sanctions_data: List[Dict[str, Any]] = []
+        self._sanctions_display: List[str] = []  # Teks listbox, paralel dengan _sanctions_data
+        self._net_status_label: Optional[QLabel] = None
+        # Pool untuk tugas lokal yang singkat (registry, tulis config).
+        # Tugas jaringan (cek update, unduhan) pakai thread daemon agar tidak menahan exit.
+        self._bg_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gcts-bg")
+        # Tulis config yang belum selesai (future → JSON) — tidak boleh hilang saat shutdown
+        self._pending_saves: Dict[Future, tuple] = {}  # future → (generation, text)
+
+        # Status registry (autostart / settings lock) di-prefetch di background
+        # agar build tab Pengaturan tidak query winreg di UI thread
+        self._autostart_cached: Optional[bool] = None
+        self._settings_locked_cached: Optional[bool] = None
+        self._bg_pool.submit(self._prefetch_system_state)
 
         if self._penalty_mgr:
             self._penalty_mgr.on_sync_callback = self._on_penalty_sync
@@ -252,6 +290,10 @@ class AdminDashboard(QMainWindow):
         except Exception:
             pass
 
+        # Apply Global QSS before any child exists so each widget is
+        # polished once on creation instead of re-polishing the whole tree
+        self.setStyleSheet(QSS)
+
         # Central Widget & Main Layout structure
         self.central_widget = QWidget()
         self.central_widget.setObjectName("MainContent")
@@ -283,26 +325,31 @@ class AdminDashboard(QMainWindow):
         self._build_content_area()
         self._build_status_bar()
 
-        # Connect timers
-        self._refresh_timer = QTimer(self)
-        self._refresh_timer.timeout.connect(self._schedule_refresh)
-        self._refresh_timer.start(REFRESH_INTERVAL_MS)
-
-        self._vu_timer = QTimer(self)
-        self._vu_timer.timeout.connect(self._update_vu_meter)
-        self._vu_timer.start(VU_METER_INTERVAL_MS)
+        # Connect timers — one heartbeat drives VU + monitor, and only
+        # while the window is visible
+        self._visible = False
+        self._tick_count = 0
+        self._tick_timer = QTimer(self)
+        self._tick_timer.setInterval(VU_METER_INTERVAL_MS)
+        self._tick_timer.timeout.connect(self._tick)
+
+        # Trailing debounce untuk slider gain (set_gain mengunci audio thread)
+        self._pending_gain = 1.0
+        self._gain_debounce = QTimer(self)
+        self._gain_debounce.setSingleShot(True)
+        self._gain_debounce.setInterval(GAIN_DEBOUNCE_MS)
+        self._gain_debounce.timeout.connect(self._apply_gain)
 
         self._net_timer = QTimer(self)
         self._net_timer.timeout.connect(self._schedule_network_status_refresh)
         self._net_timer.start(3000)
 
-        # Apply Global QSS
-        self.setStyleSheet(QSS)
-        
-        # Initial states
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+        # Initial states (other tabs are built when first opened)
         self._switch_tab(0)
-        self._refresh_wordlist_display()
-        self._refresh_guard_config_display()
 
         logger.info("✓ Admin Dashboard built (PySide6)")
 
@@ -380,13 +427,32 @@ class AdminDashboard(QMainWindow):
     def _build_content_area(self):
         self.stack = QStackedWidget()
         self.content_layout.addWidget(self.stack, 1) # expand=True
-        
-        self._build_monitor_tab()
-        self._build_wordlist_tab()
-        self._build_installer_guard_tab()
-        self._build_sanctions_tab()
-        self._build_settings_tab()
-        self._build_proximity_filter_tab()
+
+        # Tabs are built on first selection; placeholders keep stack indices
+        self._tab_builders = [
+            self._build_monitor_tab,
+            self._build_wordlist_tab,
+            self._build_installer_guard_tab,
+            self._build_sanctions_tab,
+            self._build_settings_tab,
+            self._build_proximity_filter_tab,
+        ]
+        self._tab_built = [False] * len(self._tab_builders)
+        for _ in self._tab_builders:
+            self.stack.addWidget(QWidget())
+
+    def _ensure_tab_built(self, index: int) -> None:
+        """Build tab ``index`` on first use and swap it in for its placeholder."""
+        if not 0 <= index < len(self._tab_builders) or self._tab_built[index]:
+            return
+        # Error builder dibiarkan naik; flag baru diset setelah page terpasang
+        # sehingga tab dibangun ulang (atribut widget di-assign ulang) saat dibuka lagi
+        page = self._tab_builders[index]()
+        placeholder = self.stack.widget(index)
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._tab_built[index] = True
 
     def _build_status_bar(self):
         bar = QFrame()
@@ -408,7 +474,12 @@ class AdminDashboard(QMainWindow):
         self.content_layout.addWidget(bar)
 
     def _switch_tab(self, index):
+        self._ensure_tab_built(index)
         self.stack.setCurrentIndex(index)
+        if 0 <= index < len(self._tab_builders) and self._tab_builders[index] == self._build_settings_tab:
+            # Autostart / lock Settings bisa berubah di luar dashboard
+            # (main.py saat startup, perintah server via NetworkClient)
+            self._refresh_system_state_async()
         btn = self.tab_group.button(index)
         if btn and not btn.isChecked():
             btn.setChecked(True)
@@ -488,8 +559,10 @@ class AdminDashboard(QMainWindow):
         # TextBoxes Stack
         self.monitor_stack = QStackedWidget()
         
-        self._monitor_textbox = QTextEdit()
+        # Plain-text widget: no rich-text document layout on every refresh
+        self._monitor_textbox = QPlainTextEdit()
         self._monitor_textbox.setReadOnly(True)
+        self._monitor_textbox.setUndoRedoEnabled(False)
         self.monitor_stack.addWidget(self._monitor_textbox)
         
         self._logs_table = QTableWidget()
@@ -502,7 +575,7 @@ class AdminDashboard(QMainWindow):
         self.monitor_stack.addWidget(self._logs_table)
 
         layout.addWidget(self.monitor_stack, 1)
-        self.stack.addWidget(page)
+        return page
 
     def _on_monitor_view_change(self, index):
         self.monitor_stack.setCurrentIndex(index)
@@ -510,25 +583,34 @@ class AdminDashboard(QMainWindow):
         else: self._refresh_logs()
 
     def _refresh_monitor(self, force=False):
+        if not self._visible: return
         if self.monitor_stack.currentIndex() != 0 and not force: return
-        buffer = self._logger_service.get_buffer()
+        texts, toxic_flags, matched = self._logger_service.get_columns()
         
         current_time = time.strftime("%H:%M:%S")
-        txt = f"Live transcription text time ({current_time}):\n"
+        lines = [f"Live transcription text time ({current_time}):"]
+        append = lines.append
 
-        if not buffer:
-            txt += "  (Belum ada transkripsi... bicara sekarang!)\n"
+        if not texts:
+            append("  (Belum ada transkripsi... bicara sekarang!)")
         else:
-            for entry in buffer:
-                icon = "🚨" if entry.is_toxic else "✅"
-                tag = "TOXIC" if entry.is_toxic else "SAFE"
-                words_str = f" [{', '.join(entry.matched_words)}]" if entry.matched_words else ""
-                txt += f"{icon} {tag} : {entry.text}{words_str}\n"
-
-        self._monitor_textbox.setPlainText(txt)
-        cursor = self._monitor_textbox.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self._monitor_textbox.setTextCursor(cursor)
+            for tx, tox, mw in zip(texts, toxic_flags, matched):
+                head = "🚨 TOXIC" if tox else "✅ SAFE"
+                append(f"{head} : {tx} [{mw}]" if mw else f"{head} : {tx}")
+        append("")
+
+        # Hanya auto-scroll jika user memang sedang di bagian bawah
+        bar = self._monitor_textbox.verticalScrollBar()
+        prev_value = bar.value()
+        at_bottom = prev_value >= bar.maximum() - 2
+
+        self._monitor_textbox.setPlainText("\n".join(lines))
+        if at_bottom:
+            cursor = self._monitor_textbox.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            self._monitor_textbox.setTextCursor(cursor)
+        else:
+            bar.setValue(min(prev_value, bar.maximum()))
 
         if self._stats_label:
             stats = self._logger_service.stats
@@ -551,16 +633,16 @@ class AdminDashboard(QMainWindow):
                 
             data_rows = reader[1:]
             self._logs_table.setRowCount(len(data_rows))
+            set_item = self._logs_table.setItem
+            sev_label = _SEV_LABEL.get
             
             for row_idx, row in enumerate(data_rows):
                 if len(row) >= 4:
                     ts, text, words, severity = row
-                    sev_icon = {"HIGH": "🔴 ", "MEDIUM": "🟡 ", "LOW": "🟢 "}.get(severity, "⚪ ")
-                    
-                    self._logs_table.setItem(row_idx, 0, QTableWidgetItem(ts))
-                    self._logs_table.setItem(row_idx, 1, QTableWidgetItem(text))
-                    self._logs_table.setItem(row_idx, 2, QTableWidgetItem(words))
-                    self._logs_table.setItem(row_idx, 3, QTableWidgetItem(sev_icon + severity))
+                    set_item(row_idx, 0, QTableWidgetItem(ts))
+                    set_item(row_idx, 1, QTableWidgetItem(text))
+                    set_item(row_idx, 2, QTableWidgetItem(words))
+                    set_item(row_idx, 3, QTableWidgetItem(sev_label(severity) or "⚪ " + severity))
                     
         except Exception as e:
             logger.error("Failed to refresh logs table: %s", e)
@@ -568,11 +650,11 @@ class AdminDashboard(QMainWindow):
     def _update_vu_meter(self) -> None:
         """Update all VU meter displays from the audio engine.
 
-        Called every VU_METER_INTERVAL_MS (80ms) by the QTimer.
+        Called every VU_METER_INTERVAL_MS (80ms) by ``_tick``.
         Updates both the main monitor VU meter (perceptual scale)
         and the proximity filter VU meter (raw linear RMS).
         """
-        if not self._engine:
+        if not self._engine or not self._visible:
             return
 
         # ── Main Monitor VU Meter (perceptual scale) ──
@@ -704,12 +786,10 @@ class AdminDashboard(QMainWindow):
         btn_lyt.addStretch()
         layout.addWidget(btn_frame)
 
-        self.stack.addWidget(page)
+        self._refresh_wordlist_display()
+        return page
 
     def _import_wordlist_json(self):
-        from PySide6.QtWidgets import QFileDialog
-        import json
-        
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Import Wordlist Konfigurasi", "", "JSON Files (*.json)"
         )
@@ -720,13 +800,7 @@ class AdminDashboard(QMainWindow):
             with open(file_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
                 
-            raw_tx = data.get("toxic_words", [])
-            if isinstance(raw_tx, dict):
-                flat = []
-                for k, v in raw_tx.items():
-                    flat.append(k)
-                    if isinstance(v, list): flat.extend(v)
-                raw_tx = list(set(flat))
+            raw_tx = list(set(self._flatten_toxic_words(data.get("toxic_words", []))))
             
             raw_al = data.get("allowed_words", [])
             
@@ -748,13 +822,7 @@ class AdminDashboard(QMainWindow):
         data = self._load_wordlist_json()
         if data is None: return
         
-        raw_tx = data.get("toxic_words", [])
-        if isinstance(raw_tx, dict):
-            flat = []
-            for k, v in raw_tx.items():
-                flat.append(k)
-                if isinstance(v, list): flat.extend(v)
-            raw_tx = flat
+        raw_tx = self._flatten_toxic_words(data.get("toxic_words", []))
         words = sorted(set(w.strip() for w in raw_tx if isinstance(w, str) and w.strip()))
         
         allowed = data.get("allowed_words", [])
@@ -800,7 +868,19 @@ class AdminDashboard(QMainWindow):
             
             old_data = self._load_wordlist_json() or {}
             phonetic = old_data.get("phonetic_mapping", {})
-            data = {"toxic_words": forbidden, "allowed_words": allowed, "phonetic_mapping": phonetic}
+
+            # Kata yang dihapus dari tabel ikut membuang alias fonetiknya
+            for word in self._variant_root.keys() - set(forbidden):
+                for alias in self._aliases_by_word.pop(word, ()):
+                    phonetic.pop(alias, None)
+
+            # Format {kata: [varian]} dipertahankan bila file aslinya begitu
+            toxic_words = forbidden
+            if isinstance(old_data.get("toxic_words"), dict):
+                toxic_words = self._group_toxic_words(forbidden)
+
+            data = dict(old_data)  # Kunci lain (context_exclusions, dll) ikut tersimpan
+            data.update({"toxic_words": toxic_words, "allowed_words": allowed, "phonetic_mapping": phonetic})
             
             self._save_wordlist_json(data)
             if self._detector:
@@ -816,15 +896,82 @@ class AdminDashboard(QMainWindow):
             with open(WORDLIST_PATH, "r", encoding="utf-8") as f:
                 data = json.load(f)
             if isinstance(data, list):
-                return {"toxic_words": data, "phonetic_mapping": {}, "allowed_words": []}
+                data = {"toxic_words": data, "phonetic_mapping": {}, "allowed_words": []}
             if "toxic_words" not in data: data["toxic_words"] = []
             if "phonetic_mapping" not in data: data["phonetic_mapping"] = {}
             if "allowed_words" not in data: data["allowed_words"] = []
+            self._index_wordlist(data)
             return data
         except Exception as e:
             logger.error("Failed to read wordlist: %s", e)
             return None
 
+    def _index_wordlist(self, data: dict) -> None:
+        """Build the wordlist reverse indexes in one pass at load time.
+
+        - ``self._variant_root``: kata/varian toxic → kata induknya
+          (kata di format list menjadi induk bagi dirinya sendiri).
+        - ``self._aliases_by_word``: kata toxic → alias salah-dengar dari
+          phonetic_mapping (dinormalisasi ke lowercase), sehingga menghapus
+          satu kata cukup membuang alias miliknya (O(k)) tanpa memindai
+          dan me-``lower()`` seluruh mapping.
+        """
+        variant_root: Dict[str, str] = {}
+        raw_tx = data.get("toxic_words")
+        groups = raw_tx.items() if isinstance(raw_tx, dict) else ((w, None) for w in raw_tx or [])
+        for root, variants in groups:
+            if not isinstance(root, str) or not root.strip():
+                continue
+            root = root.strip().lower()
+            variant_root[root] = root
+            if isinstance(variants, list):
+                for v in variants:
+                    if isinstance(v, str) and v.strip():
+                        variant_root.setdefault(v.strip().lower(), root)
+        self._variant_root = variant_root
+
+        mapping: Dict[str, str] = {}
+        aliases_by_word: Dict[str, List[str]] = {}
+        raw_map = data.get("phonetic_mapping")
+        if isinstance(raw_map, dict):
+            for alias, word in raw_map.items():
+                if not isinstance(alias, str) or not isinstance(word, str):
+                    continue
+                alias, word = alias.strip().lower(), word.strip().lower()
+                if alias and word:
+                    mapping[alias] = word
+                    aliases_by_word.setdefault(word, []).append(alias)
+        data["phonetic_mapping"] = mapping
+        self._aliases_by_word = aliases_by_word
+
+    def _group_toxic_words(self, words: list) -> Dict[str, List[str]]:
+        """Regroup flat table words into {kata: [varian]} via ``_variant_root``.
+
+        Kata baru menjadi induk sendiri; varian yang induknya dihapus
+        dipromosikan menjadi induk.
+        """
+        kept = set(words)
+        grouped: Dict[str, List[str]] = {}
+        for w in words:
+            root = self._variant_root.get(w, w)
+            if root not in kept:
+                root = w
+            variants = grouped.setdefault(root, [])
+            if w != root and w not in variants:
+                variants.append(w)
+        return grouped
+
+    @staticmethod
+    def _flatten_toxic_words(raw_tx) -> list:
+        """Flatten toxic_words ({kata: [varian]} or list) into a plain list."""
+        if isinstance(raw_tx, dict):
+            flat = []
+            for k, v in raw_tx.items():
+                flat.append(k)
+                if isinstance(v, list): flat.extend(v)
+            return flat
+        return raw_tx if isinstance(raw_tx, list) else []
+
     def _save_wordlist_json(self, data: dict):
         try:
             with open(WORDLIST_PATH, "w", encoding="utf-8") as f:
@@ -918,12 +1065,10 @@ class AdminDashboard(QMainWindow):
         btn_lyt.addStretch()
         layout.addWidget(btn_frame)
 
-        self.stack.addWidget(page)
+        self._refresh_guard_config_display()
+        return page
 
     def _import_guard_config_json(self):
-        from PySide6.QtWidgets import QFileDialog
-        import json
-        
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Import Installer Guard Konfigurasi", "", "JSON Files (*.json)"
         )
@@ -961,7 +1106,6 @@ class AdminDashboard(QMainWindow):
             populate(self._guard_whitelist_path_textbox, config.get("whitelist_paths", []))
 
     def _load_guard_config(self) -> dict:
-        from app._paths import GUARD_CONFIG_PATH
         if os.path.exists(GUARD_CONFIG_PATH):
             try:
                 with open(GUARD_CONFIG_PATH, "r", encoding="utf-8") as f:
@@ -977,7 +1121,6 @@ class AdminDashboard(QMainWindow):
         return {"blacklist": [], "whitelist_processes": [], "whitelist_paths": []}
 
     def _save_guard_config(self):
-        from app._paths import GUARD_CONFIG_PATH
         try:
             bl = self._get_table_words(self._guard_blacklist_textbox)
             pr = self._get_table_words(self._guard_whitelist_proc_textbox)
@@ -1111,15 +1254,11 @@ class AdminDashboard(QMainWindow):
         
         cols_lyt.addWidget(right)
         layout.addWidget(cols, 1)
-        self.stack.addWidget(page)
-        
-        self._sanctions_data = []
+
         self._load_sanctions_config()
+        return page
 
     def _import_sanctions_json(self):
-        from PySide6.QtWidgets import QFileDialog
-        import json
-        
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Import Sanctions Konfigurasi", "", "JSON Files (*.json)"
         )
@@ -1131,22 +1270,20 @@ class AdminDashboard(QMainWindow):
                 data = json.load(f)
                 
             if isinstance(data, list):
-                self._sanctions_data = data
+                self._set_sanctions(data)
             elif isinstance(data, dict) and "sanction_list" in data:
-                self._sanctions_data = data["sanction_list"]
+                self._set_sanctions(data["sanction_list"])
             else:
                 raise ValueError("Format file json sanksi tidak valid. Harus berisi array objek sanksi.")
-                
-            self._refresh_sanction_listbox()
+
             QMessageBox.information(self, "Preview Import", "Berhasil pratinjau data Sanksi dari file.\nSilakan tekan 'Simpan' untuk menerapkannya secara permanen.")
         except Exception as e:
             QMessageBox.critical(self, "Error Import", f"Gagal membaca file JSON:\n{e}")
 
     def _load_sanctions_config(self):
         if not self._auth: return
-        self._sanctions_data = self._auth.get_config("sanction_list", [])
-        if not isinstance(self._sanctions_data, list): self._sanctions_data = []
-        self._refresh_sanction_listbox()
+        data = self._auth.get_config("sanction_list", [])
+        self._set_sanctions(data if isinstance(data, list) else [])
         
         reset_min = self._auth.get_config("PenaltyResetMinutes", 60)
         if hasattr(self, '_penalty_reset_entry'):
@@ -1156,17 +1293,31 @@ class AdminDashboard(QMainWindow):
         """Called by penalty_mgr.reload_config when server updates sanctions."""
         QTimer.singleShot(0, self, self._load_sanctions_config)
 
+    @staticmethod
+    def _format_sanction(s: Dict[str, Any]) -> str:
+        stype = s.get("type", "WARNING")
+        icon = "🔒" if stype == "LOCKDOWN" else "⚠️"
+        msg_preview = s.get("message", "")[:40].replace("\n", " ")
+        delay = s.get("warning_delay", 0)
+        dur = s.get("duration", 0)
+        return f" {icon} {stype} | delay={delay}s dur={dur}s | {msg_preview}"
+
+    def _set_sanctions(self, data: List[Dict[str, Any]]) -> None:
+        """Ganti seluruh daftar sanksi (load/import) beserta teks tampilannya."""
+        self._sanctions_data = data
+        self._sanctions_display = [self._format_sanction(s) for s in data]
+        self._refresh_sanction_listbox()
+
     def _refresh_sanction_listbox(self):
         if not hasattr(self, '_sanction_listbox'): return
-        self._sanction_listbox.clear()
-        for i, s in enumerate(self._sanctions_data):
-            stype = s.get("type", "WARNING")
-            icon = "🔒" if stype == "LOCKDOWN" else "⚠️"
-            msg_preview = s.get("message", "")[:40].replace("\n", " ")
-            delay = s.get("warning_delay", 0)
-            dur = s.get("duration", 0)
-            item = QListWidgetItem(f" {icon} {stype} | delay={delay}s dur={dur}s | {msg_preview}")
-            self._sanction_listbox.addItem(item)
+        lb = self._sanction_listbox
+        # Satu kali repaint untuk seluruh daftar, bukan per item
+        lb.setUpdatesEnabled(False)
+        try:
+            lb.clear()
+            lb.addItems(self._sanctions_display)
+        finally:
+            lb.setUpdatesEnabled(True)
 
     def _on_sanction_select(self, item):
         idx = self._sanction_listbox.row(item)
@@ -1190,36 +1341,73 @@ class AdminDashboard(QMainWindow):
             "warning_delay": self._sanction_delay_entry.value()
         }
 
+    def _refresh_sanction_row(self, idx: int, op: str) -> None:
+        """Sinkronkan satu baris listbox dengan ``_sanctions_display`` (add/update/remove)."""
+        lb = self._sanction_listbox
+        if op == "add":
+            lb.addItem(self._sanctions_display[idx])
+        elif op == "update":
+            lb.item(idx).setText(self._sanctions_display[idx])
+        elif op == "remove":
+            lb.takeItem(idx)
+
     def _add_sanction(self):
-        self._sanctions_data.append(self._get_edit_fields())
-        self._refresh_sanction_listbox()
+        new = self._get_edit_fields()
+        self._sanctions_data.append(new)
+        self._sanctions_display.append(self._format_sanction(new))
+        self._refresh_sanction_row(len(self._sanctions_data) - 1, "add")
 
     def _update_sanction(self):
         idx = self._sanction_listbox.currentRow()
         if 0 <= idx < len(self._sanctions_data):
-            self._sanctions_data[idx] = self._get_edit_fields()
-            self._refresh_sanction_listbox()
+            new = self._get_edit_fields()
+            self._sanctions_data[idx] = new
+            self._sanctions_display[idx] = self._format_sanction(new)
+            self._refresh_sanction_row(idx, "update")
 
     def _remove_sanction(self):
         idx = self._sanction_listbox.currentRow()
         if 0 <= idx < len(self._sanctions_data):
             self._sanctions_data.pop(idx)
-            self._refresh_sanction_listbox()
+            self._sanctions_display.pop(idx)
+            self._refresh_sanction_row(idx, "remove")
 
     def _save_sanctions_config(self):
         if not self._auth: return
         try:
-            self._auth.update_config("sanction_list", self._sanctions_data)
+            # Deep copy: dict sanksi di config tidak boleh sama dengan yang diedit UI
+            values = {"sanction_list": copy.deepcopy(self._sanctions_data)}
             try:
-                reset_min = self._penalty_reset_entry.value()
-                self._auth.update_config("PenaltyResetMinutes", reset_min)
+                values["PenaltyResetMinutes"] = self._penalty_reset_entry.value()
             except Exception: pass
-            
+            # Update di memori + serialisasi di UI thread, tulis file di background
+            self._auth.update_config_batch(values, persist=False)
+            snapshot = self._auth.snapshot_config()
+            future = self._bg_pool.submit(self._auth.write_config_text, *snapshot)
+            self._pending_saves[future] = snapshot
+            future.add_done_callback(self._on_sanctions_saved)
+
             if self._penalty_mgr:
                 self._penalty_mgr.reload_config()
-            QMessageBox.information(self, "Berhasil", "Konfigurasi sanksi berhasil disimpan!")
         except Exception as e:
             logger.error("Failed to save sanctions config: %s", e)
+            QMessageBox.critical(self, "Gagal", f"Gagal menyimpan konfigurasi sanksi:\n{e}")
+
+    def _on_sanctions_saved(self, future: Future) -> None:
+        """Done callback (thread worker) → laporkan hasil tulis di UI thread."""
+        self._pending_saves.pop(future, None)
+        if future.cancelled():
+            return  # Ditulis ulang secara sinkron oleh shutdown()
+        error = future.exception()
+        if error is not None:
+            logger.error("✗ Failed to save sanctions config: %s", error)
+
+        def _on_ui():
+            if error is None:
+                self._open_message(QMessageBox.Information, "Berhasil", "Konfigurasi sanksi berhasil disimpan!")
+            else:
+                self._open_message(QMessageBox.Critical, "Gagal", f"Gagal menyimpan konfigurasi sanksi:\n{error}")
+        QTimer.singleShot(0, self, _on_ui)
 
     def set_audio_engine(self, engine: "AudioEngine") -> None:
         """Set the audio engine reference and initialize proximity zones.
@@ -1239,7 +1427,7 @@ class AdminDashboard(QMainWindow):
     # TAB 6: PROXIMITY FILTER
     # ================================================================
 
-    def _build_proximity_filter_tab(self) -> None:
+    def _build_proximity_filter_tab(self) -> QWidget:
         """Build the Proximity Filter tab with real-time VU meter and zone builder.
 
         The tab consists of:
@@ -1331,10 +1519,11 @@ class AdminDashboard(QMainWindow):
         zone_lyt.addWidget(scroll, 1)
 
         layout.addWidget(zone_card, 1)
-        self.stack.addWidget(page)
 
         # Zone row widget storage
         self._zone_row_widgets: List[Dict[str, Any]] = []
+        self._populate_proximity_zones()
+        return page
 
     def _create_zone_row(self, zone: Dict[str, Any]) -> None:
         """Create a single zone row with interactive widgets.
@@ -1472,19 +1661,12 @@ class AdminDashboard(QMainWindow):
                 logger.error("Failed to persist proximity zones: %s", e)
 
     def _populate_proximity_zones(self) -> None:
-        """Load zones from config and populate the UI rows.
+        """Load zones from config, sync them to the engine and the UI rows.
 
-        Called once on ``set_audio_engine`` to bootstrap the tab
-        with persisted (or default) zone configuration.
+        Called on ``set_audio_engine`` and when the tab is first built.
+        The engine is always synced; rows are only (re)created once the
+        tab exists.
         """
-        if not hasattr(self, '_zone_row_widgets'):
-            return
-
-        # Clear existing rows
-        for row in self._zone_row_widgets:
-            row["widget"].deleteLater()
-        self._zone_row_widgets = []
-
         # Load from config or use defaults
         zones: List[Dict[str, Any]] = []
         if self._auth:
@@ -1500,8 +1682,14 @@ class AdminDashboard(QMainWindow):
                 {"id": "zone_4", "name": "User Yell", "min_rms": 0.46, "max_rms": 1.00, "action": "PROCESS"},
             ]
 
-        for zone in zones:
-            self._create_zone_row(zone)
+        if hasattr(self, '_zone_row_widgets'):
+            # Clear existing rows
+            for row in self._zone_row_widgets:
+                row["widget"].deleteLater()
+            self._zone_row_widgets = []
+
+            for zone in zones:
+                self._create_zone_row(zone)
 
         # Sync to engine
         if self._engine and hasattr(self._engine, 'proximity_zones'):
@@ -1510,8 +1698,35 @@ class AdminDashboard(QMainWindow):
     # ================================================================
     # TAB 7: PENGATURAN
     # ================================================================
+    def _prefetch_system_state(self) -> None:
+        try:
+            self._autostart_cached = SystemService.is_autostart_enabled()
+            self._settings_locked_cached = SystemService.is_windows_settings_locked()
+        except Exception as e:
+            logger.debug("System state prefetch failed: %s", e)
+
+    def _refresh_system_state_async(self) -> None:
+        """Query ulang status registry di background lalu sinkronkan checkbox."""
+        def _job():
+            self._prefetch_system_state()
+            QTimer.singleShot(0, self, self._apply_system_state)
+        self._bg_pool.submit(_job)
+
+    def _apply_system_state(self) -> None:
+        for chk, value in ((getattr(self, "_chk_auto", None), self._autostart_cached),
+                           (getattr(self, "_chk_lock", None), self._settings_locked_cached)):
+            if chk is None or value is None or chk.isChecked() == value:
+                continue
+            chk.blockSignals(True)
+            chk.setChecked(value)
+            chk.blockSignals(False)
+
     def _build_settings_tab(self):
-        from app.system_service import SystemService
+        # Fallback ke query langsung jika prefetch belum selesai
+        if self._autostart_cached is None:
+            self._autostart_cached = SystemService.is_autostart_enabled()
+        if self._settings_locked_cached is None:
+            self._settings_locked_cached = SystemService.is_windows_settings_locked()
         
         page = QWidget()
         layout = QVBoxLayout(page)
@@ -1566,8 +1781,6 @@ class AdminDashboard(QMainWindow):
         c1_lyt.addWidget(self._gain_slider)
         c1_lyt.addStretch()
         c_lyt.addWidget(c1, 0, 0)
-        
-        self._populate_devices()
 
         # Server
         c2 = QFrame()
@@ -1626,12 +1839,12 @@ class AdminDashboard(QMainWindow):
         c3_lyt.addWidget(lbl_sys)
         
         self._chk_auto = QCheckBox("Auto-start saat Windows boot")
-        self._chk_auto.setChecked(SystemService.is_autostart_enabled())
+        self._chk_auto.setChecked(self._autostart_cached)
         self._chk_auto.toggled.connect(self._on_autostart_toggle)
         c3_lyt.addWidget(self._chk_auto)
         
         self._chk_lock = QCheckBox("Kunci Windows Settings")
-        self._chk_lock.setChecked(SystemService.is_windows_settings_locked())
+        self._chk_lock.setChecked(self._settings_locked_cached)
         self._chk_lock.toggled.connect(self._on_settings_lock_toggle)
         c3_lyt.addWidget(self._chk_lock)
         
@@ -1686,32 +1899,55 @@ class AdminDashboard(QMainWindow):
 
         scroll.setWidget(content)
         layout.addWidget(scroll)
-        self.stack.addWidget(page)
+
+        self.sync_audio_ui()
+        return page
 
     # ================================================================
     # AUTO-UPDATER
     # ================================================================
 
     def _check_update_action(self):
-        from app.updater import GithubUpdater
         if not self._github_repo or self._github_repo == "USERNAME/REPO_NAME":
             QMessageBox.information(self, "Info", "GitHub repo belum dikonfigurasi.")
             return
             
         def _check():
-            updater = GithubUpdater(self._github_repo, self._app_version)
+            updater = self._updater_cls()(self._github_repo, self._app_version)
             has_update, latest_version, zip_url, notes = updater.check_for_updates()
             
             def _on_ui():
                 if has_update:
-                    ans = QMessageBox.question(self, "Update!", f"V{latest_version.replace('v','')} tersedia!\n\n{notes[:300]}...\n\nUnduh sekarang?")
-                    if ans == QMessageBox.Yes: self._start_download_update(updater, zip_url)
+                    self._open_message(
+                        QMessageBox.Question, "Update!",
+                        f"V{latest_version.replace('v','')} tersedia!\n\n{notes[:300]}...\n\nUnduh sekarang?",
+                        buttons=QMessageBox.Yes | QMessageBox.No,
+                        on_yes=lambda: self._start_download_update(updater, zip_url),
+                    )
                 else:
-                    if "Gagal" in notes: QMessageBox.critical(self, "Gagal", notes)
-                    else: QMessageBox.information(self, "OK", "Sudah versi terbaru!")
+                    if "Gagal" in notes: self._open_message(QMessageBox.Critical, "Gagal", notes)
+                    else: self._open_message(QMessageBox.Information, "OK", "Sudah versi terbaru!")
             QTimer.singleShot(0, self, _on_ui)
             
-        threading.Thread(target=_check, daemon=True).start()
+        # Thread daemon (bukan _bg_pool): request jaringan bisa menunggu timeout +
+        # retry, dan worker pool di-join saat exit sehingga menahan aplikasi keluar
+        threading.Thread(target=_check, name="gcts-update-check", daemon=True).start()
+
+    def _open_message(self, icon, title: str, text: str,
+                      buttons=QMessageBox.Ok, on_yes: Optional[Callable[[], None]] = None) -> None:
+        """Window-modal QMessageBox via ``open()`` (tanpa nested ``exec()`` loop).
+
+        Timer VU meter / monitor tetap berjalan selama dialog tampil;
+        ``on_yes`` dipanggil jika user menekan tombol Yes.
+        """
+        box = QMessageBox(icon, title, text, buttons, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        if on_yes:
+            def _on_finished(_result):
+                if box.standardButton(box.clickedButton()) == QMessageBox.Yes:
+                    on_yes()
+            box.finished.connect(_on_finished)
+        box.open()
 
     def _start_download_update(self, updater, zip_url):
         # We can implement a proper QProgressDialog later if needed
@@ -1727,15 +1963,15 @@ class AdminDashboard(QMainWindow):
         try:
             devices = self._engine.list_devices()
             self._device_dropdown.clear()
+            self._device_indices = []
             if devices:
-                values = [f"{idx}: {name}" for idx, name in devices]
-                self._device_dropdown.addItems(values)
+                self._device_indices = [idx for idx, _ in devices]
+                self._device_dropdown.addItems([f"{idx}: {name}" for idx, name in devices])
                 
                 current_idx = self._engine.input_device_index
                 if current_idx is not None:
-                    target_idx = 0
-                    for i, v in enumerate(values):
-                        if v.startswith(str(current_idx) + ":"): target_idx = i; break
+                    try: target_idx = self._device_indices.index(current_idx)
+                    except ValueError: target_idx = 0
                     self._device_dropdown.setCurrentIndex(target_idx)
             else:
                 self._device_dropdown.addItem("No devices")
@@ -1754,21 +1990,25 @@ class AdminDashboard(QMainWindow):
             self._gain_label.setText(f"{current_gain:.1f}x")
 
     def _on_device_change(self, target_idx):
-        if not self._engine or target_idx < 0: return
-        choice = self._device_dropdown.itemText(target_idx)
-        if choice == "No devices" or choice == "Default": return
+        # "Default" / "No devices" tidak punya entri di shadow list
+        if not self._engine or not 0 <= target_idx < len(self._device_indices): return
+        device_index = self._device_indices[target_idx]
         try:
-            device_index = int(choice.split(":")[0])
             self._engine.set_input_device(device_index)
             if self._auth: self._auth.update_config("InputDeviceIndex", device_index)
-            logger.info("Switched audio device to: %s", choice)
+            logger.info("Switched audio device to index %d", device_index)
         except Exception as e:
             logger.error("Failed to set device: %s", e)
 
     def _on_gain_change(self, value_int):
         gain_val = float(value_int) / 10.0
-        if self._engine: self._engine.set_gain(gain_val)
         if self._gain_label: self._gain_label.setText(f"{gain_val:.1f}x")
+        self._pending_gain = gain_val
+        self._gain_debounce.start()  # restart → hanya nilai terakhir yang diterapkan
+
+    def _apply_gain(self):
+        gain_val = self._pending_gain
+        if self._engine: self._engine.set_gain(gain_val)
         if self._auth: self._auth.update_config("AudioGain", gain_val)
 
     # ================================================================
@@ -1815,23 +2055,19 @@ class AdminDashboard(QMainWindow):
         try:
             client = getattr(self, '_network_client', None)
             if client and client.is_connected:
-                self._net_status_label.setText("● Terhubung")
-                self._net_status_label.setStyleSheet(f"color: {SUCCESS}; font-size: 11px;")
-                if self._header_server_badge:
-                    self._header_server_badge.setText("● SERVER ONLINE")
-                    self._header_server_badge.setStyleSheet(f"color: {SUCCESS}; font-weight: bold; font-size: 11px;")
+                status, badge, color = "● Terhubung", "● SERVER ONLINE", SUCCESS
             elif client:
-                self._net_status_label.setText("● Menghubungkan...")
-                self._net_status_label.setStyleSheet(f"color: {WARNING}; font-size: 11px;")
-                if self._header_server_badge:
-                    self._header_server_badge.setText("● CONNECTING")
-                    self._header_server_badge.setStyleSheet(f"color: {WARNING}; font-weight: bold; font-size: 11px;")
+                status, badge, color = "● Menghubungkan...", "● CONNECTING", WARNING
             else:
-                self._net_status_label.setText("● Tidak Terhubung")
-                self._net_status_label.setStyleSheet(f"color: {MUTED}; font-size: 11px;")
-                if self._header_server_badge:
-                    self._header_server_badge.setText("● OFFLINE")
-                    self._header_server_badge.setStyleSheet(f"color: {MUTED}; font-weight: bold; font-size: 11px;")
+                status, badge, color = "● Tidak Terhubung", "● OFFLINE", MUTED
+
+            # Label status ada di tab Pengaturan (belum tentu sudah dibangun)
+            if self._net_status_label:
+                self._net_status_label.setText(status)
+                self._net_status_label.setStyleSheet(f"color: {color}; font-size: 11px;")
+            if self._header_server_badge:
+                self._header_server_badge.setText(badge)
+                self._header_server_badge.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 11px;")
         except Exception: pass
 
     # ================================================================
@@ -1839,21 +2075,19 @@ class AdminDashboard(QMainWindow):
     # ================================================================
 
     def _emergency_exit(self):
-        from app.system_service import SystemService
         logger.warning("🆘 EMERGENCY EXIT triggered")
         if getattr(self, '_penalty_mgr', None) and hasattr(self._penalty_mgr, '_overlay'):
             if self._penalty_mgr._overlay: self._penalty_mgr._overlay.dismiss()
         SystemService.emergency_release_hooks()
 
     def _on_autostart_toggle(self, checked):
-        from app.system_service import SystemService
-        if checked: SystemService.enable_autostart()
-        else: SystemService.disable_autostart()
+        ok = SystemService.enable_autostart() if checked else SystemService.disable_autostart()
+        if ok: self._autostart_cached = checked
 
     def _on_settings_lock_toggle(self, checked):
-        from app.system_service import SystemService
         success = SystemService.toggle_windows_settings(checked)
         if success:
+            self._settings_locked_cached = checked
             if self._auth: self._auth._config["BlockSettings"] = checked; self._auth._save_config()
             QMessageBox.information(self, "OK", f"Settings: {'TERKUNCI' if checked else 'TERBUKA'}")
         else:
@@ -1863,7 +2097,6 @@ class AdminDashboard(QMainWindow):
             self._chk_lock.blockSignals(False)
 
     def _on_installer_lock_toggle(self, checked):
-        from app.system_service import SystemService
         success = SystemService.toggle_installer_block(checked)
         if success:
             if self._auth: self._auth._config["BlockInstaller"] = checked; self._auth._save_config()
@@ -1894,9 +2127,69 @@ class AdminDashboard(QMainWindow):
         else:
             QMessageBox.critical(self, "Error", "Gagal mengubah password.")
 
+    def _tick(self):
+        """UI heartbeat: VU meter every tick, monitor every REFRESH_TICKS."""
+        self._update_vu_meter()
+        self._tick_count += 1
+        if self._tick_count >= REFRESH_TICKS:
+            self._tick_count = 0
+            self._schedule_refresh()
+
     def _schedule_refresh(self):
         self._refresh_monitor()
 
+    # ================================================================
+    # WINDOW VISIBILITY
+    # ================================================================
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._set_live_updates(not self.isMinimized())
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._set_live_updates(False)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._set_live_updates(self.isVisible() and not self.isMinimized())
+
+    def _set_live_updates(self, active: bool) -> None:
+        """Start or stop the monitor & VU heartbeat.
+
+        Saat dashboard disembunyikan ke tray atau di-minimize tidak ada
+        yang perlu digambar ulang, jadi timer dihentikan total dan
+        dinyalakan lagi (dengan satu refresh langsung) saat tampil.
+        """
+        if active == self._visible:
+            return
+        self._visible = active
+        if active:
+            self._tick_count = 0
+            self._tick_timer.start()
+            self._refresh_monitor()
+        else:
+            self._tick_timer.stop()
+
+    def shutdown(self) -> None:
+        """Hentikan semua timer dashboard & pool background saat aplikasi keluar."""
+        if self._gain_debounce.isActive():
+            self._apply_gain()  # Jangan buang perubahan gain yang masih tertunda
+        for timer in self.findChildren(QTimer):
+            timer.stop()
+        # Prefetch / cek update boleh dibatalkan; tulis config tidak
+        pending = list(self._pending_saves.items())
+        self._bg_pool.shutdown(wait=False, cancel_futures=True)
+        for future, snapshot in pending:
+            try:
+                if future.cancelled():
+                    self._auth.write_config_text(*snapshot)
+                else:
+                    future.result()  # Tunggu tulis yang sedang berjalan
+            except Exception as e:
+                logger.error("✗ Failed to flush config on shutdown: %s", e)
+
     def closeEvent(self, event):
         if self._on_close: self._on_close()
         event.accept()
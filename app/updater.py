@@ -1,17 +1,134 @@
 import os
+import re
 import sys
 import json
 import time
+import hashlib
 import zipfile
-import urllib.request
-import urllib.error
 import threading
 import subprocess
 import shutil
 import logging
+from functools import lru_cache
+from concurrent.futures import Future
+from typing import Optional
+
+import urllib3
+from urllib3.util import Retry
+
+from app._paths import UPDATE_CACHE_PATH
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger("GCToxicShield.Updater")
 
+_COPY_BUFSIZE = 1 << 20  # 1 MiB
+_VER_RE = re.compile(r'\d+')
+
+# Field payload rilis yang dipakai updater
+_RELEASE_KEYS = ("tag_name", "body", "assets")
+
+_USER_AGENT = "GCToxicShield-Updater"
+
+# Perintah instalasi (dijalankan via ``cmd /S /C``, tanpa file .bat).
+# - Delay via ping loopback: timeout /T selalu gagal tanpa console
+#   (DETACHED_PROCESS), jadi ping adalah satu-satunya delay yang andal
+# - robocopy /E (bukan /MIR: config & log lokal di app_dir harus tetap ada);
+#   retry bawaan (/R /W), exit code < 8 = sukses
+# - Dipisah '&' (bukan '&&'): robocopy mengembalikan 1 saat ada file tersalin
+#   dan taskkill gagal jika proses sudah keluar
+# - Upgrade dari layout lama (_internal/) ke lib/: setelah robocopy sukses
+#   (errorlevel < 8) dan lib/ ada, hapus _internal/ agar runtime lama tidak tertinggal
+_INSTALL_CMD = (
+    'ping 127.0.0.1 -n 4 >nul'
+    ' & taskkill /F /IM "{exe_name}" /T >nul 2>&1'
+    ' & ping 127.0.0.1 -n 2 >nul'
+    ' & robocopy "{source_dir}" "{app_dir}" /E /R:5 /W:2 /MT:8 /NFL /NDL /NJH /NJS /NP >nul 2>&1'
+    ' & (if not errorlevel 8 if exist "{app_dir}\\lib\\" rmdir /S /Q "{app_dir}\\_internal" >nul 2>&1)'
+    ' & rmdir /S /Q "{stage_dir}" >nul 2>&1'
+    ' & start /B "" "{exe_path}" --background'
+    ' & del "{zip_path}" >nul 2>&1'
+)
+
+_http_lock = threading.Lock()
+_http: Optional[urllib3.PoolManager] = None
+
+
+def _get_http() -> urllib3.PoolManager:
+    """PoolManager bersama: koneksi TCP+TLS dipakai ulang antar cek update & unduhan."""
+    global _http
+    with _http_lock:
+        if _http is None:
+            _http = urllib3.PoolManager(
+                maxsize=2,
+                retries=Retry(3, backoff_factor=0.3),
+                headers={"User-Agent": _USER_AGENT},
+            )
+        return _http
+
+
+def _run_daemon(fn, name: str) -> Future:
+    """
+    Jalankan ``fn`` di thread daemon dan kembalikan Future-nya.
+    Bukan ThreadPoolExecutor: worker pool di-join saat interpreter keluar,
+    sehingga unduhan / request yang sedang menunggu timeout akan menahan exit.
+    """
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def _target():
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=_target, name=name, daemon=True).start()
+    return future
+
+
+@lru_cache(maxsize=8)
+def _parse_ver(v_str: str) -> tuple:
+    # Ekstrak semua grup angka dalam string (misal "v.1.0.5" -> ["1", "0", "5"])
+    numbers = _VER_RE.findall(v_str)
+    if not numbers:
+        return (0, 0, 0)
+    return tuple(map(int, (numbers + ["0", "0"])[:3]))
+
+
+class _HashingWriter:
+    """
+    File wrapper untuk ``shutil.copyfileobj`` yang sekaligus menghitung hash
+    dan (opsional) melaporkan progress tiap kelipatan 2% dari ``total_size``.
+    """
+
+    def __init__(self, fileobj, hasher, total_size: int = 0, on_progress=None):
+        self._f = fileobj
+        self._h = hasher
+        self.written = 0
+        self._total = total_size if on_progress else 0
+        self._on_progress = on_progress
+        # Ambang byte → tanpa pembagian per chunk
+        self._pct_step = max(1, total_size // 50) if self._total else 0
+        self._next_threshold = self._pct_step
+        self._last_reported = -1
+
+    def write(self, data):
+        self._h.update(data)
+        self.written += len(data)
+        n = self._f.write(data)
+        if self._total and self.written >= self._next_threshold:
+            # Lompati semua ambang yang terlewati chunk ini (chunk bisa > pct_step)
+            self._next_threshold = (self.written // self._pct_step + 1) * self._pct_step
+            percent = self.written * 100 // self._total
+            if percent != self._last_reported:
+                self._last_reported = percent
+                self._on_progress(f"Mengunduh... {percent}%")
+        return n
+
+
 class GithubUpdater:
     """
     Modul untuk memeriksa pembaruan dari Release GitHub,
@@ -22,7 +139,9 @@ class GithubUpdater:
         self.repo = repo_path
         self.current_version = current_version
         self.api_url = f"https://api.github.com/repos/{self.repo}/releases/latest"
-        self._dl_thread = None
+        self._dl_future: Optional[Future] = None
+        # SHA-256 aset ZIP dari field "digest" rilis terakhir (jika tersedia)
+        self.asset_sha256 = ""
 
     def check_for_updates(self):
         """
@@ -32,55 +151,116 @@ class GithubUpdater:
         if not self.repo or self.repo == "USERNAME/REPO_NAME":
             return False, "", "", "Repository belum dikonfigurasi. Ubah di file main.py."
 
+        cache = self._load_release_cache()
+        headers = {'User-Agent': _USER_AGENT}
+        if cache.get("etag"):
+            headers['If-None-Match'] = cache["etag"]
+
         try:
-            req = urllib.request.Request(self.api_url, headers={'User-Agent': 'GCToxicShield-Updater'})
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                
-            latest_version = data.get("tag_name", "")
-            if not latest_version:
-                return False, "", "", ""
-                
-            import re
-
-            def parse_ver(v_str):
-                # Ekstrak semua grup angka dalam string (misal "v.1.0.5" -> ["1", "0", "5"])
-                numbers = re.findall(r'\d+', v_str)
-                if not numbers:
-                    return (0, 0, 0)
-                try:
-                    return tuple(map(int, (numbers + ["0", "0"])[:3]))
-                except ValueError:
-                    return (0, 0, 0)
-                
-            if parse_ver(latest_version) > parse_ver(self.current_version):
-                assets = data.get("assets", [])
-                zip_url = ""
-                for asset in assets:
-                    if asset.get("name", "").endswith(".zip"):
-                        zip_url = asset.get("browser_download_url")
-                        break
-                
-                if zip_url:
-                    return True, latest_version, zip_url, data.get("body", "Ada pembaruan sistem baru.")
-                    
-            return False, latest_version, "", ""
+            response = _get_http().request(
+                "GET", self.api_url, headers=headers, preload_content=False, timeout=10.0
+            )
+            try:
+                if response.status == 304:
+                    # 304 Not Modified: rilis tidak berubah, pakai payload tersimpan
+                    logger.debug("Release info not modified (ETag hit)")
+                    return self._evaluate_release(cache.get("release") or {})
+                if response.status == 404:
+                    return False, "", "", "Versi terbaru tidak ditemukan. Mungkin Anda belum pernah membuat 'Release' (Rilis) publik sama sekali di GitHub Anda."
+                if response.status != 200:
+                    logger.error("HTTP Error saat mengecek update: %s", response.status)
+                    return False, "", "", f"Gagal terhubung ke GitHub: HTTP {response.status}"
+
+                data = self._read_release(response)
+                etag = response.headers.get("ETag")
+            finally:
+                # Sisa body dibuang agar koneksi bisa kembali ke pool
+                response.drain_conn()
+                response.release_conn()
+
+            if etag:
+                self._save_release_cache(etag, data)
+            return self._evaluate_release(data)
                 
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                return False, "", "", "Versi terbaru tidak ditemukan. Mungkin Anda belum pernah membuat 'Release' (Rilis) publik sama sekali di GitHub Anda."
-            logger.error("HTTP Error saat mengecek update: %s", e)
-            return False, "", "", f"Gagal terhubung ke GitHub: HTTP {e.code}"
         except Exception as e:
             logger.error("Gagal mengecek update: %s", e)
             return False, "", "", f"Gagal mengecek update: {e}"
 
-    def download_and_install_async(self, download_url: str, on_progress=None, on_complete=None, on_error=None):
+    @staticmethod
+    def _read_release(response) -> dict:
+        """Parse payload rilis; dengan ijson berhenti setelah field yang dibutuhkan terbaca."""
+        if ijson is None:
+            return json.loads(response.read().decode())
+
+        data = {}
+        for key, value in ijson.kvitems(response, ""):
+            if key in _RELEASE_KEYS:
+                data[key] = value
+                if len(data) == len(_RELEASE_KEYS):
+                    break
+        return data
+
+    def _evaluate_release(self, data: dict):
+        """Bandingkan payload rilis dengan versi saat ini → tuple hasil ``check_for_updates``."""
+        latest_version = data.get("tag_name", "")
+        if not latest_version:
+            return False, "", "", ""
+            
+        if _parse_ver(latest_version) > _parse_ver(self.current_version):
+            assets = data.get("assets", [])
+            zip_url = ""
+            for asset in assets:
+                if asset.get("name", "").endswith(".zip"):
+                    zip_url = asset.get("browser_download_url")
+                    digest = asset.get("digest") or ""
+                    self.asset_sha256 = digest[7:].lower() if digest.startswith("sha256:") else ""
+                    break
+            
+            if zip_url:
+                return True, latest_version, zip_url, data.get("body", "Ada pembaruan sistem baru.")
+                
+        return False, latest_version, "", ""
+
+    def _load_release_cache(self) -> dict:
+        try:
+            with open(UPDATE_CACHE_PATH, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            # File terpotong / asing bisa berisi JSON valid non-dict → anggap miss
+            if (isinstance(cache, dict) and cache.get("repo") == self.repo
+                    and isinstance(cache.get("etag"), str)
+                    and isinstance(cache.get("release"), dict)):
+                return cache
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _save_release_cache(self, etag: str, data: dict) -> None:
+        # Simpan hanya field yang dipakai _evaluate_release
+        release = {
+            "tag_name": data.get("tag_name", ""),
+            "body": data.get("body", ""),
+            "assets": [
+                {k: a.get(k) for k in ("name", "browser_download_url", "digest")}
+                for a in data.get("assets", [])
+            ],
+        }
+        try:
+            with open(UPDATE_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump({"repo": self.repo, "etag": etag, "release": release}, f)
+        except OSError as e:
+            logger.debug("Failed to write update cache: %s", e)
+
+    def download_and_install_async(self, download_url: str, on_progress=None, on_complete=None, on_error=None,
+                                   expected_sha256: str = None):
         """
-        Mengunduh .zip dari GitHub, dan membuat script .bat untuk men-timpa
+        Mengunduh .zip dari GitHub, dan menjalankan perintah cmd untuk men-timpa
         file instalasi ketika aplikasi (GCToxicShield.exe) ditutup, lalu restart otomatis.
+
+        SHA-256 dihitung sambil mengunduh dan dicocokkan dengan ``expected_sha256``
+        (default: digest aset dari ``check_for_updates``) bila tersedia.
         """
-        if self._dl_thread and self._dl_thread.is_alive():
+        expected = (expected_sha256 or self.asset_sha256 or "").lower()
+        if self._dl_future and not self._dl_future.done():
             return
             
         def _worker():
@@ -90,29 +270,37 @@ class GithubUpdater:
                 
                 # 1. Download File
                 if on_progress: on_progress("Mengunduh pembaruan dari GitHub...")
-                req = urllib.request.Request(download_url, headers={'User-Agent': 'GCToxicShield-Updater'})
-                with urllib.request.urlopen(req, timeout=30) as response, open(zip_path, 'wb') as out_file:
-                    total_size_str = response.info().get('Content-Length')
+                response = _get_http().request(
+                    "GET", download_url, preload_content=False,
+                    timeout=urllib3.Timeout(connect=10.0, read=30.0),
+                )
+                if response.status != 200:
+                    response.drain_conn()
+                    response.release_conn()
+                    raise IOError(f"Gagal mengunduh pembaruan: HTTP {response.status}")
+
+                with response, open(zip_path, 'wb') as out_file:
+                    total_size_str = response.headers.get('Content-Length')
                     total_size = int(total_size_str.strip()) if total_size_str else 0
                     
-                    downloaded = 0
-                    chunk_size = 16384
-                    while True:
-                        buffer = response.read(chunk_size)
-                        if not buffer:
-                            break
-                        downloaded += len(buffer)
-                        out_file.write(buffer)
-                        
-                        if total_size > 0 and on_progress:
-                            percent = int(downloaded * 100 / total_size)
-                            # Update UI state secara berkala
-                            if percent % 5 == 0: 
-                                on_progress(f"Mengunduh... {percent}%")
+                    sha = hashlib.sha256()
+                    # Chunk 1 MiB; progress dilaporkan writer (jika total diketahui)
+                    writer = _HashingWriter(out_file, sha, total_size, on_progress)
+                    shutil.copyfileobj(response, writer, _COPY_BUFSIZE)
+                    downloaded = writer.written
+
+                if total_size and downloaded != total_size:
+                    raise IOError(f"Unduhan tidak lengkap ({downloaded}/{total_size} bytes)")
+                if expected and sha.hexdigest() != expected:
+                    raise IOError("Checksum SHA-256 file pembaruan tidak cocok")
                             
-                # 2. Persiapkan Script Batch Instalasi
+                # 2. Ekstrak ke folder staging (masih di thread worker)
+                if on_progress: on_progress("Mengekstrak pembaruan...")
+                source_dir = self._extract_update(zip_path)
+
+                # 3. Jalankan perintah instalasi
                 if on_progress: on_progress("Menyiapkan instalasi otomatis...")
-                self._spawn_update_script(zip_path)
+                self._spawn_update_script(zip_path, source_dir)
                 
                 if on_complete: on_complete("Siap! Aplikasi akan direstart dalam 3 detik untuk menerapkan pembaruan.")
                 
@@ -120,79 +308,68 @@ class GithubUpdater:
                 logger.error("Pembaruan gagal: %s", e)
                 if on_error: on_error(str(e))
                 
-        self._dl_thread = threading.Thread(target=_worker, daemon=True)
-        self._dl_thread.start()
+        self._dl_future = _run_daemon(_worker, "gcts-update-download")
         
-    def _spawn_update_script(self, zip_path: str):
+    @staticmethod
+    def _staging_dir() -> str:
+        temp_dir = os.environ.get("TEMP", "C:\\Temp")
+        return os.path.join(temp_dir, "gctoxic_stage")
+
+    def _extract_update(self, zip_path: str) -> str:
+        """
+        Mengekstrak ZIP rilis ke folder staging dengan zipfile (tanpa PowerShell).
+        Returns folder di dalam staging yang berisi executable aplikasi.
+        """
+        stage_dir = self._staging_dir()
+        if os.path.exists(stage_dir):
+            shutil.rmtree(stage_dir, ignore_errors=True)
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            zf.extractall(stage_dir)
+        logger.info("ZIP extracted to %s", stage_dir)
+
+        # Cari exe di dalam folder hasil ekstrak untuk menentukan source_dir
+        exe_name = self._exe_name()
+        for root, dirs, files in os.walk(stage_dir):
+            if exe_name in files:
+                return root
+        return stage_dir
+
+    @staticmethod
+    def _exe_name() -> str:
+        exe_name = os.path.basename(sys.argv[0])
+        if not exe_name.endswith(".exe"):
+            exe_name = "GC Toxic Shield.exe"
+        return exe_name
+
+    def _spawn_update_script(self, zip_path: str, source_dir: str):
         """
-        Membuat dan mengeksekusi script Batch lepas kendali yang akan membumi-hanguskan
-        proses GC Toxic Shield saat ini, mengekstrak rilis terbaru, dan menyalakannya lagi.
+        Menjalankan perintah cmd lepas kendali yang akan membumi-hanguskan proses
+        GC Toxic Shield saat ini, menyalin rilis yang sudah diekstrak, dan menyalakannya lagi.
         """
         app_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
         # Koreksi path jika jalan di dev Python (bukan dicompile)
         if "app" in app_dir or "build_tools" in app_dir:
             app_dir = os.path.dirname(app_dir)
             
-        exe_name = os.path.basename(sys.argv[0])
-        if not exe_name.endswith(".exe"):
-            exe_name = "GC Toxic Shield.exe"
-
-        temp_dir = os.environ.get("TEMP", "C:\\Temp")
-        extract_dir = os.path.join(temp_dir, "GCT_Update_Ext")
-        bat_path = os.path.join(temp_dir, "gctoxic_update.bat")
-
-        # 1. Extract ZIP using Python's zipfile (avoids PowerShell dependency)
-        try:
-            if os.path.exists(extract_dir):
-                shutil.rmtree(extract_dir, ignore_errors=True)
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                zf.extractall(extract_dir)
-            logger.info("ZIP extracted to %s", extract_dir)
-        except Exception as e:
-            logger.error("Failed to extract update ZIP: %s", e)
-            return
-
-        # 2. Find the exe inside extracted folder to determine source_dir
-        source_dir = extract_dir
-        for root, dirs, files in os.walk(extract_dir):
-            if exe_name in files:
-                source_dir = root
-                break
-
-        # 3. Generate batch script with retry loop
-        bat_content = f"""@echo off
-ping 127.0.0.1 -n 4 > nul
-taskkill /F /IM "{exe_name}" /T > nul 2>&1
-ping 127.0.0.1 -n 2 > nul
-
-set RETRY=0
-:COPY_RETRY
-xcopy "{source_dir}\\*" "{app_dir}\\" /Y /E /H /R /Q > nul 2>&1
-if %ERRORLEVEL% NEQ 0 (
-  set /A RETRY+=1
-  if %RETRY% LSS 5 (
-    ping 127.0.0.1 -n 3 > nul
-    goto COPY_RETRY
-  )
-)
-
-if exist "{extract_dir}" rmdir /S /Q "{extract_dir}"
-
-start /B "" "{os.path.join(app_dir, exe_name)}" --background
+        exe_name = self._exe_name()
+        install_cmd = _INSTALL_CMD.format(
+            exe_name=exe_name,
+            source_dir=source_dir,
+            app_dir=app_dir,
+            stage_dir=self._staging_dir(),
+            exe_path=os.path.join(app_dir, exe_name),
+            zip_path=zip_path,
+        )
+        comspec = os.environ.get("COMSPEC", "cmd.exe")
 
-del "{zip_path}" > nul 2>&1
-del "%~f0"
-"""
-        with open(bat_path, "w") as f:
-            f.write(bat_content)
-            
         # Spawn execution in background without locking current process
         subprocess.Popen(
-            [bat_path], 
-            creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS
+            f'"{comspec}" /S /C "{install_cmd}"',
+            creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+            close_fds=True,
         )
         
-        # Self-destruct thread to allow the batch script to kill it safely and replace files
+        # Self-destruct thread to allow the install command to kill it safely and replace files
         def _exit_app():
             time.sleep(1.5)
             # Exit brutal ensuring no locks
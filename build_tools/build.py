@@ -6,26 +6,34 @@
 # karena tidak perlu bundle torch, faster-whisper, ctranslate2.
 #
 # Usage:
-#   python build_tools/build.py
+#   python build_tools/build.py            (incremental, pakai cache Analysis)
+#   python build_tools/build.py --clean    (hapus cache, Analysis dari nol)
 #
 # Expected output:
 #   dist/GC Toxic Shield/
 #   ├── GC Toxic Shield.exe    (executable + admin manifest)
-#   ├── _internal/        (libraries)      (word_list.json)
+#   ├── lib/                 (runtime, DLLs, assets/)
 #   └── logs/                (auto-created)
 # =============================================================
 
 import os
 import sys
-import subprocess
+import hashlib
 import shutil
 
 # ── Paths ──
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 BUILD_TOOLS = os.path.join(PROJECT_ROOT, "build_tools")
 DIST_DIR = os.path.join(PROJECT_ROOT, "dist", "GC Toxic Shield")
-MANIFEST_PATH = os.path.join(BUILD_TOOLS, "gc_toxic_shield.manifest")
-MAIN_PY = os.path.join(PROJECT_ROOT, "main.py")
+SPEC_PATH = os.path.join(BUILD_TOOLS, "gc_toxic_shield.spec")
+# Workpath tetap → PyInstaller memakai ulang TOC Analysis antar build
+WORK_DIR = os.path.join(PROJECT_ROOT, "build", "cache")
+FINGERPRINT_PATH = os.path.join(WORK_DIR, ".build_fingerprint")
+# Input yang mengubah graf dependensi; perubahan source biasa cukup incremental
+FINGERPRINT_INPUTS = [
+    os.path.join(PROJECT_ROOT, "requirements.txt"),
+    SPEC_PATH,
+]
 
 
 def check_pyinstaller():
@@ -38,7 +46,26 @@ def check_pyinstaller():
         return False
 
 
-def build():
+def compute_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for path in FINGERPRINT_INPUTS:
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(path.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def read_fingerprint() -> str:
+    try:
+        with open(FINGERPRINT_PATH, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def build(clean: bool = False):
     print("\n" + "━" * 60)
     print("  GC Toxic Shield — Build Script (Google Speech Edition) v2.0.0")
     print("━" * 60 + "\n")
@@ -46,153 +73,55 @@ def build():
     if not check_pyinstaller():
         sys.exit(1)
 
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
+    fingerprint = compute_fingerprint()
+    if clean:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+        print("  ✓ Build cache cleared (--clean)")
+    elif fingerprint != read_fingerprint():
+        print("  ⟳ requirements/spec changed — full Analysis")
+        clean = True
+
+    # Semua opsi (hidden imports, excludes, filter bloat, optimize=2) ada di spec
+    args = [
         "--noconfirm",
-        "--name", "GC Toxic Shield",
-        "--onedir",                # Startup lebih cepat di PC klien
-        "--windowed",              # Produksi: sembunyikan terminal agar lebih aman dari heuristik AV
-        "--manifest", MANIFEST_PATH,  # UAC admin prompt → keyboard hook stabil
-
-        # ── Collect-all (UI + Tray + Pillow) ──
-        "--collect-all", "pillow",          # Fix 'No module named PIL' di .exe
-        "--collect-all", "PIL",             # Explicitly collect PIL namespace
-        "--collect-all", "pystray",         # System Tray — ikon + menu
-
-        # ── Bundle Assets ──
-        "--add-data", f"{os.path.join(PROJECT_ROOT, 'assets')}{os.pathsep}assets",
-
-        # ── Hidden imports ──
-        "--hidden-import", "speech_recognition",
-        "--hidden-import", "pyaudio",
-        "--hidden-import", "pystray",
-        "--hidden-import", "PIL",
-        "--hidden-import", "PIL._tkinter_finder",
-        "--hidden-import", "PIL._imagingtk",   # Ikon tray muncul sempurna
-        "--hidden-import", "sounddevice",
-        "--hidden-import", "numpy",            # Dibutuhkan untuk gain audio
-        "--hidden-import", "PySide6",
-        "--hidden-import", "PySide6.QtWidgets",
-        "--hidden-import", "PySide6.QtCore",
-        "--hidden-import", "PySide6.QtGui",
-        "--hidden-import", "ctypes",
-        "--hidden-import", "requests",
-        "--hidden-import", "pkg_resources.extern",
-        "--hidden-import", "watchdog",
-
-        # App modules
-        "--hidden-import", "app._paths",
-        "--hidden-import", "app.audio_engine",
-        "--hidden-import", "app.detector",
-        "--hidden-import", "app.logger_service",
-        "--hidden-import", "app.overlay",
-        "--hidden-import", "app.penalty_manager",
-        "--hidden-import", "app.ui_manager",
-        "--hidden-import", "app.system_service",
-        "--hidden-import", "app.auth_service",
-        "--hidden-import", "app.login_dialog",
-        "--hidden-import", "app.static_data",
-        "--hidden-import", "app.network_client",
-        "--hidden-import", "app.installer_guard",
-        "--hidden-import", "app.updater",
-
-        # ── Exclude bloat (AI offline + lib tidak terpakai) ──
-        "--exclude-module", "torch",
-        "--exclude-module", "torchaudio",
-        "--exclude-module", "faster_whisper",
-        "--exclude-module", "ctranslate2",
-        "--exclude-module", "scipy",
-        "--exclude-module", "matplotlib",
-        "--exclude-module", "notebook",
-        "--exclude-module", "cv2",
-        "--exclude-module", "pytest",
-        "--exclude-module", "test",
-        "--exclude-module", "unittest",
-        "--exclude-module", "numba",
-        "--exclude-module", "llvmlite",
-        "--exclude-module", "librosa",
-        "--exclude-module", "pandas",
-        "--exclude-module", "pocketsphinx",
-        "--exclude-module", "sphinx",
-        "--exclude-module", "lxml",
-        "--exclude-module", "h5py",
-        "--exclude-module", "sklearn",
-        "--exclude-module", "tkinter.test",
-        "--exclude-module", "tkinter",
-        "--exclude-module", "customtkinter",
-
-        # Icon
-        "--icon", os.path.join(PROJECT_ROOT, "assets", "icon.ico"),
-
-        # Output
         "--distpath", os.path.join(PROJECT_ROOT, "dist"),
-        "--workpath", os.path.join(PROJECT_ROOT, "build"),
-        "--specpath", BUILD_TOOLS,
-
-        MAIN_PY,
+        "--workpath", WORK_DIR,
+        SPEC_PATH,
     ]
+    if clean:
+        args.insert(0, "--clean")
 
     print("  Building (much smaller now — no torch/whisper!)...")
     print()
 
-    result = subprocess.run(cmd, cwd=PROJECT_ROOT)
+    # In-process: tanpa spawn interpreter kedua & import ulang PyInstaller
+    from PyInstaller.__main__ import run as pyinstaller_run
 
-    if result.returncode != 0:
+    os.chdir(PROJECT_ROOT)
+    try:
+        rc = pyinstaller_run(args) or 0
+    except SystemExit as e:
+        # PyInstaller memanggil sys.exit() saat error konfigurasi/spec
+        rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception as e:
+        print(f"\n  ✗ PyInstaller error: {e}")
+        rc = 1
+
+    if rc != 0:
         print("\n  ✗ Build FAILED!")
         sys.exit(1)
 
     print("\n  ✓ Build completed!")
 
+    os.makedirs(WORK_DIR, exist_ok=True)
+    with open(FINGERPRINT_PATH, "w", encoding="utf-8") as f:
+        f.write(fingerprint)
+
     # ── Create empty folders ──
     logs_dst = os.path.join(DIST_DIR, "logs")
     os.makedirs(logs_dst, exist_ok=True)
     print(f"  ✓ logs/ created")
 
-    # ── Post-Build Cleanup (Crucial for <30MB size) ──
-    print("\n  Cleaning up offline AI bloat...")
-    bloat_files = [
-        "language-model.lm.bin",
-        "pronounciation-dictionary.dict",
-        "mdef",
-        "sendump",
-        "logdists",
-        "feat.params",
-        "variances",
-        "transition_matrices",
-        "means",
-        "mixture_weights",
-        "noisedict",
-        "feature_transform",
-    ]
-    
-    # Remove files
-    cleanup_count = 0
-    for root, dirs, files in os.walk(DIST_DIR):
-        for name in files:
-            if name in bloat_files or name.startswith("mfc140"):
-                try:
-                    os.remove(os.path.join(root, name))
-                    print(f"    - Removed: {name}")
-                    cleanup_count += 1
-                except Exception as e:
-                    print(f"    ! Failed to remove {name}: {e}")
-            elif name.endswith(".pyd") and ("scipy" in name or "sklearn" in name):
-                 try:
-                    os.remove(os.path.join(root, name))
-                    print(f"    - Removed: {name}")
-                    cleanup_count += 1
-                 except Exception:
-                    pass
-            elif "linux" in name or "darwin" in name or "macos" in name:
-                try:
-                    os.remove(os.path.join(root, name))
-                    print(f"    - Removed OS bloat: {name}")
-                    cleanup_count += 1
-                except Exception:
-                    pass
-
-    print(f"  ✓ Cleanup finished ({cleanup_count} files removed)")
-
     # ── Summary ──
     print("\n" + "━" * 60)
     print("  ✅ BUILD SUCCESSFUL!")
@@ -200,8 +129,8 @@ def build():
     print()
     print("  Isi distribusi:")
     print("    GC Toxic Shield.exe  ← Jalankan (auto UAC prompt)")
-    print("    _internal/         ← Runtime + DLLs")
-    print("    assets/            ← word_list.json")
+    print("    lib/               ← Runtime + DLLs")
+    print("    lib/assets/        ← word_list.json, ikon")
     print("    logs/              ← CSV output")
     print()
     print("  ⚠ PENTING: PC klien HARUS punya koneksi internet!")
@@ -215,4 +144,4 @@ def build():
 
 
 if __name__ == "__main__":
-    build()
+    build(clean="--clean" in sys.argv[1:])
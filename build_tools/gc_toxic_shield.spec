@@ -0,0 +1,201 @@
+# -*- mode: python ; coding: utf-8 -*-
+# =============================================================
+# GC Toxic Shield — PyInstaller Spec
+# =============================================================
+# Dipakai oleh build_tools/build.py:
+#   python -m PyInstaller --noconfirm build_tools/gc_toxic_shield.spec
+#
+# - optimize=2  → .pyc tanpa assert & docstring (PYZ lebih kecil)
+# - Bloat difilter dari a.binaries / a.datas SEBELUM COLLECT,
+#   jadi tidak ada file yang disalin lalu dihapus lagi.
+# =============================================================
+
+import os
+import re
+import sys
+from pkgutil import walk_packages
+
+from PyInstaller.utils.hooks import collect_all, collect_submodules
+
+PROJECT_ROOT = os.path.dirname(SPECPATH)
+APP_NAME = "GC Toxic Shield"
+
+# ── Hidden imports ──
+HIDDEN = [
+    "speech_recognition",
+    "pyaudio",
+    "pystray",
+    "PIL.Image",
+    "PIL._tkinter_finder",
+    "PIL._imagingtk",   # Ikon tray muncul sempurna
+    "sounddevice",      # numpy ikut via import langsung di app.audio_engine
+    "PySide6",
+    "PySide6.QtWidgets",
+    "PySide6.QtCore",
+    "PySide6.QtGui",
+    "ctypes",
+    "requests",
+    "pkg_resources.extern",
+    "watchdog",
+]
+
+# App modules — ditemukan otomatis dari folder app/ (tanpa meng-import package)
+HIDDEN += [m.name for m in walk_packages([os.path.join(PROJECT_ROOT, "app")], prefix="app.")]
+
+# ── Exclude bloat (AI offline + lib tidak terpakai) ──
+EXCLUDES = [
+    "torch",
+    "torchaudio",
+    "faster_whisper",
+    "ctranslate2",
+    "scipy",
+    "matplotlib",
+    "notebook",
+    "cv2",
+    "pytest",
+    "test",
+    "unittest",
+    "numba",
+    "llvmlite",
+    "librosa",
+    "pandas",
+    "pocketsphinx",
+    "sphinx",
+    "lxml",
+    "h5py",
+    "sklearn",
+    "tkinter.test",
+    "tkinter",
+    "customtkinter",
+    "pyaudio.tests",
+]
+
+# Backend pystray non-Windows — pystray memilih backend via import dinamis
+# berdasarkan platform, jadi di Windows hanya pystray._win32 yang dimuat
+PYSTRAY_OTHER_BACKENDS = (
+    "pystray._gtk",
+    "pystray._appindicator",
+    "pystray._darwin",
+    "pystray._xorg",
+    "pystray._dummy",
+    "pystray._util.gtk",
+    "pystray._util.notify_dbus",
+)
+EXCLUDES += PYSTRAY_OTHER_BACKENDS
+
+# Model PocketSphinx (offline STT) yang ikut terbawa speech_recognition
+BLOAT_FILES = frozenset({
+    "language-model.lm.bin",
+    "pronounciation-dictionary.dict",
+    "mdef",
+    "sendump",
+    "logdists",
+    "feat.params",
+    "variances",
+    "transition_matrices",
+    "means",
+    "mixture_weights",
+    "noisedict",
+    "feature_transform",
+})
+
+# mfc140*, .pyd scipy/sklearn, dan file khusus OS lain — satu regex (nama lowercase)
+BLOAT_RE = re.compile(r"^mfc140|(?:scipy|sklearn).*\.pyd$|linux|darwin|macos")
+
+
+def is_bloat(dest: str) -> bool:
+    name = os.path.basename(dest)
+    return name in BLOAT_FILES or BLOAT_RE.search(name.lower()) is not None
+
+
+# Simbol debug, import library linker & metadata wheel yang tidak dibaca saat runtime
+# (METADATA tetap disimpan untuk importlib.metadata)
+DEBUG_RE = re.compile(r"\.(?:pdb|exp|lib)$|\.dist-info[/\\](?:RECORD|WHEEL|INSTALLER|REQUESTED)$", re.IGNORECASE)
+
+# Varian PortAudio yang tidak dimuat: sounddevice hanya memakai
+# libportaudio{32,64}bit.dll sesuai arsitektur Python (ASIO hanya jika
+# SD_ENABLE_ASIO di-set); backend DirectSound/ASIO tidak dipakai app
+PORTAUDIO_OTHER_BITS = "32" if sys.maxsize > 2**32 else "64"
+PORTAUDIO_UNUSED_RE = re.compile(
+    rf"(?:^|[/\\_-])(?:asio|dsound)|wdmks_debug|libportaudio{PORTAUDIO_OTHER_BITS}bit", re.IGNORECASE
+)
+
+# Terjemahan Qt (*.qm): app tidak memasang QTranslator, semua teks UI
+# sudah hardcoded — seluruh folder translations PySide6 tidak pernah dibaca
+QT_TRANSLATIONS_RE = re.compile(r"PySide6[/\\](?:Qt[/\\])?translations[/\\]", re.IGNORECASE)
+
+# Ekstensi C Pillow yang tidak dipakai (app hanya membuka PNG ikon tray)
+PIL_UNUSED_RE = re.compile(r"PIL[/\\]_(?:imaging(?:cms|ft|math|morph)|webp|avif)\.", re.IGNORECASE)
+
+# ── Collect-all (Tray) — Pillow cukup lewat hook standar + HIDDEN di atas ──
+# Hanya file assets yang dibaca saat runtime (lihat app._paths & main.py);
+# assets/config.json tidak pernah dibaca dari bundle (config ada di APPDATA)
+RUNTIME_ASSETS = ("word_list.json", "icon.png", "icon.ico", "tray_fallback.png")
+datas = [(os.path.join(PROJECT_ROOT, "assets", name), "assets") for name in RUNTIME_ASSETS]
+binaries = []
+hiddenimports = list(HIDDEN)
+pkg_datas, pkg_binaries, pkg_hidden = collect_all("pystray")
+datas += [d for d in pkg_datas if not is_bloat(d[0])]
+binaries += pkg_binaries
+hiddenimports += [m for m in pkg_hidden if not m.startswith(PYSTRAY_OTHER_BACKENDS)]
+# ijson memilih backend (yajl2_c → yajl2 → python) via import dinamis;
+# tanpa ini build frozen jatuh ke backend pure-Python / json biasa
+hiddenimports += collect_submodules("ijson.backends")
+
+
+a = Analysis(
+    [os.path.join(PROJECT_ROOT, "main.py")],
+    pathex=[PROJECT_ROOT],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    excludes=EXCLUDES,
+    # Package app selalu di dalam PYZ (satu arsip, bukan .pyc per file).
+    # Aman: __file__ di app/* hanya dipakai pada cabang non-frozen.
+    module_collection_mode={"app": "pyz"},
+    optimize=2,
+    noarchive=False,
+)
+
+a.binaries = [
+    b for b in a.binaries
+    if not is_bloat(b[0])
+    and not PIL_UNUSED_RE.search(b[0])
+    and not PORTAUDIO_UNUSED_RE.search(b[0])
+    and not DEBUG_RE.search(b[0])
+]
+a.datas = [
+    d for d in a.datas
+    if not is_bloat(d[0])
+    and not PORTAUDIO_UNUSED_RE.search(d[0])
+    and not DEBUG_RE.search(d[0])
+    and not QT_TRANSLATIONS_RE.search(d[0])
+]
+
+# strip hanya efektif untuk binary ELF/Mach-O; UPX dimatikan (startup lambat & false-positive AV)
+STRIP = sys.platform != "win32"
+
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name=APP_NAME,
+    contents_directory="lib",  # Runtime + DLLs di lib/ (default PyInstaller: _internal/)
+    console=False,      # Produksi: sembunyikan terminal agar lebih aman dari heuristik AV
+    manifest=os.path.join(SPECPATH, "gc_toxic_shield.manifest"),  # UAC admin prompt → keyboard hook stabil
+    icon=os.path.join(PROJECT_ROOT, "assets", "icon.ico"),
+    strip=STRIP,
+    upx=False,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=STRIP,
+    upx=False,
+    name=APP_NAME,
+)
@@ -0,0 +1,37 @@
+# =============================================================
+# GC Toxic Shield — Tray Fallback Icon Generator
+# =============================================================
+# Menghasilkan assets/tray_fallback.png (perisai merah 64x64)
+# yang dipakai main.create_tray_image() jika icon.png tidak ada.
+# Dijalankan sekali saat ikon perlu diubah; hasilnya di-commit.
+#
+# Usage:
+#   python build_tools/gen_tray_icon.py
+# =============================================================
+
+import os
+
+from PIL import Image, ImageDraw
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_PATH = os.path.join(PROJECT_ROOT, "assets", "tray_fallback.png")
+
+
+def generate() -> str:
+    image = Image.new('RGBA', (64, 64), (0, 0, 0, 0))
+    dc = ImageDraw.Draw(image)
+
+    # Draw Shield shape
+    dc.polygon(
+        [(32, 60), (4, 20), (4, 4), (60, 4), (60, 20)],
+        fill="#D32F2F", outline="white"
+    )
+    # Draw "GC" text placeholder (white rect)
+    dc.rectangle([20, 15, 44, 40], fill="white")
+
+    image.save(OUTPUT_PATH, optimize=True)
+    return OUTPUT_PATH
+
+
+if __name__ == "__main__":
+    print(f"  ✓ Generated {generate()}")
@@ -18,18 +18,27 @@ import logging
 import threading
 import time
 
+from app._paths import IS_FROZEN
+
 # ── CRITICAL: Set working directory untuk PyInstaller ────────
-if getattr(sys, 'frozen', False):
+if IS_FROZEN:
     os.chdir(os.path.dirname(sys.executable))
 
 # ── Logging Configuration ────────────────────────────────────
 LOG_FORMAT = "%(asctime)s [%(name)s] %(levelname)s: %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-# Ensure stdout can support UTF-8 (emojis) on Windows
-if sys.platform == "win32":
-    if sys.stdout:
-        sys.stdout.reconfigure(encoding='utf-8')
+# Build windowed (console=False): bootloader tidak punya console dan
+# sys.stdout/sys.stderr = None. Arahkan ke NUL agar write() dari library
+# pihak ketiga tidak crash, dan pakai NullHandler supaya record log tidak
+# diformat sama sekali.
+HAS_CONSOLE = sys.stdout is not None
+
+if not HAS_CONSOLE:
+    sys.stdout = sys.stderr = open(os.devnull, "w", encoding="utf-8")
+elif sys.platform == "win32":
+    # Ensure stdout can support UTF-8 (emojis) on Windows
+    sys.stdout.reconfigure(encoding='utf-8')
     if sys.stderr:
         sys.stderr.reconfigure(encoding='utf-8')
 
@@ -38,7 +47,7 @@ logging.basicConfig(
     format=LOG_FORMAT,
     datefmt=LOG_DATE_FORMAT,
     handlers=[
-        logging.StreamHandler(sys.stdout),
+        logging.StreamHandler(sys.stdout) if HAS_CONSOLE else logging.NullHandler(),
     ],
 )
 
@@ -50,6 +59,30 @@ APP_VERSION = "2.0.0"
 BRAND = "GC Net Security Suite"
 GITHUB_REPO = "galangjrr/GC-Toxic-Shield"  # <-- Admin warns to replace this
 
+# ── Win32 API (prototype di-bind sekali saat import) ─────────
+ERROR_ALREADY_EXISTS = 183
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _shell32 = ctypes.WinDLL("shell32")
+    _user32 = ctypes.WinDLL("user32")
+
+    _CreateMutexW = _kernel32.CreateMutexW
+    _CreateMutexW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR]
+    _CreateMutexW.restype = wintypes.HANDLE
+
+    _IsUserAnAdmin = _shell32.IsUserAnAdmin
+    _IsUserAnAdmin.argtypes = []
+    _IsUserAnAdmin.restype = wintypes.BOOL
+
+    _MessageBoxW = _user32.MessageBoxW
+    _MessageBoxW.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.UINT]
+    _MessageBoxW.restype = ctypes.c_int
+else:
+    _CreateMutexW = _IsUserAnAdmin = _MessageBoxW = None
+
 
 def show_messagebox(title: str, message: str, icon_type: int = 0x10):
     """
@@ -57,17 +90,19 @@ def show_messagebox(title: str, message: str, icon_type: int = 0x10):
     icon_type: 0x10 (Error), 0x30 (Warning), 0x40 (Info)
     """
     try:
-        ctypes.windll.user32.MessageBoxW(0, message, title, icon_type)
+        if _MessageBoxW is None:
+            raise OSError("MessageBoxW tidak tersedia di platform ini")
+        _MessageBoxW(None, message, title, icon_type)
     except Exception as e:
         print(f"\n  [{title}] {message}\n")
         logger.error("Failed to show MessageBox: %s", e)
 
 
 def check_admin() -> bool:
-    try:
-        return ctypes.windll.shell32.IsUserAnAdmin() != 0
-    except AttributeError:
+    if _IsUserAnAdmin is None:
         return True
+    try:
+        return _IsUserAnAdmin() != 0
     except Exception as e:
         logger.error("Admin check failed: %s", e)
         return False
@@ -123,11 +158,16 @@ def enforce_singleton():
     """
     Memastikan hanya satu instance aplikasi yang berjalan.
     """
+    if _CreateMutexW is None:
+        return None
+
     mutex_name = "Global\\GC_Toxic_Shield_Mutex_v2"
-    mutex = ctypes.windll.kernel32.CreateMutexW(None, False, mutex_name)
-    last_error = ctypes.windll.kernel32.GetLastError()
-    
-    if last_error == 183:  # ERROR_ALREADY_EXISTS
+    mutex = _CreateMutexW(None, False, mutex_name)
+    # use_last_error=True: error disimpan ctypes tepat setelah panggilan,
+    # tidak tertimpa panggilan Win32 lain dari interpreter
+    last_error = ctypes.get_last_error()
+
+    if last_error == ERROR_ALREADY_EXISTS:
         logger.warning("Another instance is already running.")
         show_messagebox(
             "GC Toxic Shield",
@@ -138,6 +178,16 @@ def enforce_singleton():
         sys.exit(0)
     return mutex
 
+
+def _preflight():
+    """
+    Cek awal yang murah (singleton + admin) dalam satu langkah.
+    Return: (mutex, is_admin). Instance kedua langsung sys.exit(0).
+    """
+    mutex = enforce_singleton()
+    return mutex, check_admin()
+
+
 _app_mutex = None
 
 
@@ -145,40 +195,27 @@ def create_tray_image():
     """
     Membuat icon untuk System Tray.
     Mencoba load dari assets/icon.png terlebih dahulu.
-    Fallback ke gambar perisai jika file tidak ditemukan.
+    Fallback ke assets/tray_fallback.png (perisai merah, dibuat oleh
+    build_tools/gen_tray_icon.py) jika file tidak ditemukan.
     """
     try:
-        from PIL import Image, ImageDraw
-        from app._paths import ICON_PNG_PATH
-        
-        if os.path.exists(ICON_PNG_PATH):
-            return Image.open(ICON_PNG_PATH)
-        
-        # Buat icon sederhana (Perisai Merah 64x64) fallback
-        width = 64
-        height = 64
-        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        dc = ImageDraw.Draw(image)
-        
-        # Draw Shield shape
-        dc.polygon(
-            [(32, 60), (4, 20), (4, 4), (60, 4), (60, 20)],
-            fill="#D32F2F", outline="white"
-        )
-        # Draw "GC" text placeholder (white rect)
-        dc.rectangle([20, 15, 44, 40], fill="white")
-        
-        return image
+        from PIL import Image
+    except ImportError:
+        # Should be caught by main import check, but just in case
+        raise RuntimeError("PIL not installed")
 
-    except Exception as e:
-        logger.error("Failed to generate tray icon: %s", e)
-        # Fallback: Solid Red Box
+    from app._paths import ICON_PNG_PATH, TRAY_FALLBACK_PNG_PATH
+
+    for path in (ICON_PNG_PATH, TRAY_FALLBACK_PNG_PATH):
+        if not os.path.exists(path):
+            continue
         try:
-            from PIL import Image
-            return Image.new('RGB', (64, 64), color='red')
-        except ImportError:
-            # Should be caught by main import check, but just in case
-            raise RuntimeError("PIL not installed")
+            return Image.open(path)
+        except Exception as e:
+            logger.error("Failed to load tray icon %s: %s", path, e)
+
+    # Fallback: Solid Red Box
+    return Image.new('RGB', (64, 64), color='red')
 
 
 def main():
@@ -190,33 +227,43 @@ def main():
         logger.info("  %s V%s", APP_NAME, APP_VERSION)
         logger.info("  %s", BRAND)
         logger.info("━" * 50)
-        
-        # Step 0: Dependency Check (Tray libs)
-        try:
-            import pystray
-            from PIL import Image, ImageDraw
-        except ImportError as e:
+
+        # Step 0: Singleton + admin — sebelum import library berat apa pun,
+        # agar instance kedua langsung keluar tanpa biaya import
+        _app_mutex, is_admin = _preflight()
+
+        # Step 1: Dependency Check (Tray libs) — cukup cek keberadaan modul;
+        # import pystray sendiri ditunda ke _setup_tray() setelah event loop jalan
+        from importlib.util import find_spec
+
+        missing = [name for name in ("pystray", "PIL") if find_spec(name) is None]
+        if missing:
             msg = (
-                f"Library System Tray tidak ditemukan:\n{e}\n\n"
+                f"Library System Tray tidak ditemukan:\n{', '.join(missing)}\n\n"
                 f"Mohon install dependencies:\n"
                 f"pip install -r requirements.txt"
             )
             show_messagebox("GC Toxic Shield — Dependency Error", msg, 0x10)
             sys.exit(1)
 
-        _app_mutex = enforce_singleton()
+        # Step 2: Validasi/migrasi assets di background — I/O disk (copy
+        # config & wordlist ke APPDATA) overlap dengan import app modules di bawah
+        assets_ok = []
+        assets_thread = threading.Thread(
+            target=lambda: assets_ok.append(validate_assets_directory()),
+            name="gcts-assets",
+            daemon=True,
+        )
+        assets_thread.start()
 
-        if getattr(sys, 'frozen', False):
+        if IS_FROZEN:
             logger.info("Running as PyInstaller bundle")
         else:
             logger.info("Running in development mode")
 
-        if not check_admin():
+        if not is_admin:
             logger.warning("⚠ Tidak berjalan sebagai Administrator!")
 
-        if not validate_assets_directory():
-            sys.exit(1)
-
         # ── Import App Modules ──
         try:
             from app.audio_engine import AudioEngine
@@ -231,9 +278,15 @@ def main():
             from app.network_client import NetworkClient
             from app.installer_guard import InstallerGuard
         except ImportError as e:
+            assets_thread.join()  # Jangan keluar di tengah copy wordlist/config
             show_messagebox("GC Toxic Shield — Import Error", str(e), 0x10)
             sys.exit(1)
 
+        # Wordlist & config harus siap sebelum service dibuat
+        assets_thread.join()
+        if not (assets_ok and assets_ok[0]):
+            sys.exit(1)
+
         # --- Init Services ---
         logger.info("Initializing Services...")
         detector = ToxicDetector()
@@ -406,7 +459,7 @@ def main():
             auth_service.logout()
             def _on_exit_success():
                 logger.info("Exit authenticated — shutting down")
-                tray_icon.stop()
+                _stop_tray()
                 app.quit()
             def _on_exit_cancel():
                 logger.info("Exit cancelled by user")
@@ -432,24 +485,41 @@ def main():
             """Tray → Exit (Emits signal to main thread)"""
             tray_comm.sig_exit_app.emit()
 
-        tray_menu = pystray.Menu(
-            pystray.MenuItem("Settings...", on_open_dashboard_tray, default=True),
-            pystray.MenuItem("Restart Engine", on_restart_engine_tray),
-            pystray.MenuItem("Exit", on_exit_app_tray),
-        )
+        tray_holder = {}
 
-        try:
-            icon_image = create_tray_image()
-            tray_icon = pystray.Icon(
-                "GCToxicShield",
-                icon_image,
-                "GC Toxic Shield",
-                menu=tray_menu
-            )
-        except Exception as e:
-            logger.error("Tray init failed: %s", e)
-            show_messagebox("GC Toxic Shield — Tray Error", f"Gagal memuat Tray Icon: {e}", 0x10)
-            sys.exit(1)
+        def _setup_tray():
+            """
+            Import pystray + bangun ikon tray (main thread, setelah event loop
+            berjalan) lalu jalankan message loop pystray di thread sendiri.
+            """
+            try:
+                import pystray
+
+                tray_menu = pystray.Menu(
+                    pystray.MenuItem("Settings...", on_open_dashboard_tray, default=True),
+                    pystray.MenuItem("Restart Engine", on_restart_engine_tray),
+                    pystray.MenuItem("Exit", on_exit_app_tray),
+                )
+                tray_icon = pystray.Icon(
+                    "GCToxicShield",
+                    create_tray_image(),
+                    "GC Toxic Shield",
+                    menu=tray_menu
+                )
+            except Exception as e:
+                logger.error("Tray init failed: %s", e)
+                show_messagebox("GC Toxic Shield — Tray Error", f"Gagal memuat Tray Icon: {e}", 0x10)
+                app.exit(1)
+                return
+
+            tray_holder["icon"] = tray_icon
+            threading.Thread(target=tray_icon.run, daemon=True).start()
+            logger.info("  🛡  System Tray    : ACTIVE")
+
+        def _stop_tray():
+            tray_icon = tray_holder.get("icon")
+            if tray_icon is not None:
+                tray_icon.stop()
 
         # ── Window Management ──
 
@@ -474,13 +544,14 @@ def main():
             logger.info("Starting in FOREGROUND mode (Silent — Tray only)")
             root.hide()
 
-        # Run Tray in Thread
-        threading.Thread(target=tray_icon.run, daemon=True).start()
+        # Tray dibangun sesaat setelah event loop mulai — import pystray &
+        # registrasi window class Win32 tidak menahan startup
+        QTimer.singleShot(200, _setup_tray)
 
         # Status Banner
         logger.info("━" * 50)
         logger.info("  🎙  Audio Engine   : ACTIVE (online, Google Speech)")
-        logger.info("  🛡  System Tray    : ACTIVE")
+        logger.info("  🛡  System Tray    : STARTING")
         logger.info("  🖥️  Dashboard      : %s", "HIDDEN" if start_hidden else "VISIBLE")
         logger.info("━" * 50)
 
@@ -491,7 +562,7 @@ def main():
         installer_guard.disable()
         engine.stop()
         logger_svc.stop()
-        tray_icon.stop()
+        _stop_tray()
         if network_client:
             network_client.stop()
 